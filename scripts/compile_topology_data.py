@@ -0,0 +1,82 @@
+"""
+Compile skyknit/topology/data/*.yaml into skyknit/topology/_compiled_data.py.
+
+The generated module holds the parsed YAML tables as Python literals plus a
+digest of the source files. TopologyRegistry loads it instead of parsing YAML
+whenever the digest still matches the files on disk, so a stale compiled
+module only costs speed, never correctness.
+
+Usage:
+    uv run python scripts/compile_topology_data.py          # regenerate
+    uv run python scripts/compile_topology_data.py --check  # exit 1 if stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import pprint
+import sys
+
+import yaml
+
+from skyknit.topology.registry import _DATA_DIR, _TABLE_FILES, _source_digest
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+_OUTPUT = _DATA_DIR.parent / "_compiled_data.py"
+
+_HEADER = '''"""
+Precompiled topology lookup tables.
+
+GENERATED by scripts/compile_topology_data.py from skyknit/topology/data/*.yaml.
+Do not edit by hand; re-run the script after changing any YAML table.
+"""
+
+from typing import Any
+
+'''
+
+
+def render() -> str:
+    """Return the source text of the compiled module for the current YAML files."""
+    tables = {
+        filename: yaml.load((_DATA_DIR / filename).read_bytes(), Loader=_Loader)
+        for filename in _TABLE_FILES
+    }
+    body = pprint.pformat(tables, width=100, sort_dicts=False)
+    return (
+        _HEADER
+        + f'SOURCE_DIGEST = "{_source_digest(_DATA_DIR)}"\n\n'
+        + f"TABLES: dict[str, dict[str, Any]] = {body}\n"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit non-zero if the compiled module is out of date instead of rewriting it",
+    )
+    args = parser.parse_args(argv)
+
+    source = render()
+    current = _OUTPUT.read_text() if _OUTPUT.exists() else None
+    if args.check:
+        if current != source:
+            print(
+                f"{_OUTPUT} is out of date; run scripts/compile_topology_data.py", file=sys.stderr
+            )
+            return 1
+        return 0
+    if current != source:
+        _OUTPUT.write_text(source)
+        print(f"wrote {_OUTPUT}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
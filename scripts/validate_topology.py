@@ -0,0 +1,37 @@
+"""
+Validate the topology lookup tables' cross-references.
+
+Builds a TopologyRegistry from the given data directory (the packaged tables
+by default) and runs TopologyRegistry.validate() explicitly, so the check
+also happens under ``python -O``, where construction skips it for the
+packaged tables.
+
+Usage:
+    uv run python scripts/validate_topology.py [DATA_DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from skyknit.topology.registry import _DATA_DIR, TopologyRegistry
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("data_dir", nargs="?", type=Path, default=_DATA_DIR)
+    args = parser.parse_args(argv)
+
+    try:
+        TopologyRegistry(data_dir=args.data_dir).validate()
+    except (FileNotFoundError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(f"topology tables in {args.data_dir} are consistent")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -341,12 +341,12 @@ def _assemble_join(pj: ParsedJoin) -> Join:
 
     Raises ValueError if join_type string is not a valid JoinType member.
     """
-    return Join(
+    return Join.create(
         id=pj.id,
         join_type=JoinType(pj.join_type),  # raises ValueError on unrecognized string
         edge_a_ref=pj.edge_a_ref,
         edge_b_ref=pj.edge_b_ref,
-        parameters=pj.parameters,  # Join.__post_init__ promotes dict → MappingProxyType
+        parameters=pj.parameters,  # Join.create wraps the dict in a MappingProxyType
     )
 
 
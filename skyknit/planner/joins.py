@@ -44,9 +44,10 @@ def build_join(
     Build a ``Join`` from *join_spec*, populating parameters from the registry defaults.
 
     The topology registry's defaults table is keyed by
-    ``(edge_type_a, edge_type_b, join_type)``; the returned dict is used as
-    the join's ``parameters``.  For join types with no defaults (e.g.
-    CONTINUATION, HELD_STITCH) this resolves to an empty dict.
+    ``(edge_type_a, edge_type_b, join_type)``; the returned read-only mapping
+    is shared as the join's ``parameters`` without copying.  For join types
+    with no defaults (e.g. CONTINUATION, HELD_STITCH) this resolves to an
+    empty mapping.
 
     Raises ``ValueError`` if either edge ref cannot be resolved.
     """
@@ -59,12 +60,12 @@ def build_join(
         join_spec.join_type,
     )
 
-    return Join(
+    return Join.create(
         id=join_spec.id,
         join_type=join_spec.join_type,
         edge_a_ref=join_spec.edge_a_ref,
         edge_b_ref=join_spec.edge_b_ref,
-        parameters=defaults,  # Join.__post_init__ promotes dict → MappingProxyType
+        parameters=defaults,  # already a MappingProxyType; shared, never copied
     )
 
 
@@ -10,7 +10,7 @@ Edge and Join objects are reused from topology — schemas does not redefine the
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from types import MappingProxyType
 
@@ -33,7 +33,7 @@ class Handedness(str, Enum):
     NONE = "NONE"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComponentSpec:
     """
     Specification for a single named component of the sweater.
@@ -45,6 +45,8 @@ class ComponentSpec:
         edges: Ordered tuple of typed edges bounding this component.
         handedness: LEFT, RIGHT, or NONE for unpaired components.
         instantiation_count: How many times this spec is instantiated (e.g. 2 for sleeves).
+        full_refs: Derived ``"component.edge"`` ref for each entry of ``edges``,
+            in the same order. Not a constructor argument.
     """
 
     name: str
@@ -53,15 +55,20 @@ class ComponentSpec:
     edges: tuple[Edge, ...]
     handedness: Handedness
     instantiation_count: int
+    full_refs: tuple[str, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if isinstance(self.dimensions, dict):
             object.__setattr__(self, "dimensions", MappingProxyType(self.dimensions))
+        # Formatted once here so validators resolving join refs never rebuild them.
+        object.__setattr__(
+            self, "full_refs", tuple(f"{self.name}.{edge.name}" for edge in self.edges)
+        )
         if self.instantiation_count < 1:
             raise ValueError(f"instantiation_count must be >= 1, got {self.instantiation_count}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShapeManifest:
     """
     Complete structural topology of the sweater.
@@ -69,7 +76,27 @@ class ShapeManifest:
     Attributes:
         components: All component specs.
         joins: All joins connecting component edges.
+        edge_refs: Derived flat ``"component.edge"`` ref of every edge, in
+            component then edge order. Not a constructor argument.
+        edge_join_refs: Derived ``join_ref`` of every edge, parallel to
+            ``edge_refs``. Not a constructor argument.
+        join_ids: Derived set of every join id. Not a constructor argument.
     """
 
     components: tuple[ComponentSpec, ...]
     joins: tuple[Join, ...]
+    edge_refs: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    edge_join_refs: tuple[str | None, ...] = field(init=False, repr=False, compare=False)
+    join_ids: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Flat parallel views so per-edge validation passes skip the nested walk.
+        object.__setattr__(
+            self, "edge_refs", tuple(ref for c in self.components for ref in c.full_refs)
+        )
+        object.__setattr__(
+            self,
+            "edge_join_refs",
+            tuple(edge.join_ref for c in self.components for edge in c.edges),
+        )
+        object.__setattr__(self, "join_ids", frozenset(join.id for join in self.joins))
@@ -0,0 +1,297 @@
+"""
+Precompiled topology lookup tables.
+
+GENERATED by scripts/compile_topology_data.py from skyknit/topology/data/*.yaml.
+Do not edit by hand; re-run the script after changing any YAML table.
+"""
+
+from typing import Any
+
+SOURCE_DIGEST = "d2d96c427b4180982bd0593ebb2cae8ac97468802ba995453251ab1057c27e22"
+
+TABLES: dict[str, dict[str, Any]] = {'edge_types.yaml': {'version': '1.0',
+                     'entries': [{'id': 'CAST_ON',
+                                  'description': 'Starting edge where stitches are created. The '
+                                                 'component begins here. Stitches are on the '
+                                                 'needle but have not yet been worked by the '
+                                                 'yarn.\n',
+                                  'has_live_stitches': False,
+                                  'is_terminal': False,
+                                  'phase_constraint': 'start',
+                                  'notes': 'The cast-on row itself. In a top-down sweater the yoke '
+                                           'typically begins with a CAST_ON edge at the collar. '
+                                           'Cast-on stitches are on the needle (unlike BOUND_OFF) '
+                                           'but are not "live" in the active-work sense — they are '
+                                           'the destination of a CAST_ON_JOIN and become a '
+                                           'LIVE_STITCH boundary only after the first row is '
+                                           'worked. has_live_stitches is false to distinguish this '
+                                           'phase from a LIVE_STITCH edge.\n'},
+                                 {'id': 'LIVE_STITCH',
+                                  'description': 'Active stitches currently on the needle, ready '
+                                                 'to be transferred, held, or continued into the '
+                                                 'next component.\n',
+                                  'has_live_stitches': True,
+                                  'is_terminal': False,
+                                  'phase_constraint': 'any',
+                                  'notes': 'The primary boundary type for seamless and held-stitch '
+                                           'joins. This is the Hamiltonian frontier of the '
+                                           'knitting graph — the active working boundary at any '
+                                           'point in construction.\n'},
+                                 {'id': 'BOUND_OFF',
+                                  'description': 'Finished edge; all stitches have been bound off. '
+                                                 'No live stitches remain.\n',
+                                  'has_live_stitches': False,
+                                  'is_terminal': False,
+                                  'phase_constraint': 'end',
+                                  'notes': 'Used as the source side of PICKUP joins and both sides '
+                                           'of SEAM joins. Typical in set-in sleeve construction '
+                                           'and bottom-up shoulder seams.\n'},
+                                 {'id': 'SELVEDGE',
+                                  'description': 'Selvedge or row-end edge from which stitches can '
+                                                 'be picked up. This is a lateral boundary of a '
+                                                 'component, running along knitted rows rather '
+                                                 'than across them.\n',
+                                  'has_live_stitches': False,
+                                  'is_terminal': False,
+                                  'phase_constraint': 'any',
+                                  'notes': 'Lateral boundary of a component. Stitches are created '
+                                           'from the existing fabric structure. Common for button '
+                                           'bands (front selvedge) and sleeve pickup in bottom-up '
+                                           'construction.\n'},
+                                 {'id': 'OPEN',
+                                  'description': 'Terminal edge with no join. Represents a '
+                                                 'deliberate open boundary: cuff, hem, neckline, '
+                                                 'or any edge that is left unjoined.\n',
+                                  'has_live_stitches': False,
+                                  'is_terminal': True,
+                                  'phase_constraint': 'end',
+                                  'notes': 'Has no join slot. Live stitch presence is '
+                                           'INSTANCE-DEPENDENT, not a type-level guarantee: a cuff '
+                                           'worked in the round and left on the needle has live '
+                                           'stitches; a hemmed edge does not. has_live_stitches is '
+                                           'therefore false at the type level (no structural '
+                                           'guarantee). The Planner sets a per-instance '
+                                           'live_stitches flag when building the shape manifest. '
+                                           'The Writer renders OPEN edges as pattern endings (e.g. '
+                                           '"Break yarn", "Leave sts on needle for '
+                                           'grafting").\n'}]},
+ 'join_types.yaml': {'version': '1.0',
+                     'entries': [{'id': 'CONTINUATION',
+                                  'description': 'Working yarn continues seamlessly from one '
+                                                 'component into the next. No yarn break, no '
+                                                 'cast-on, no pickup. The Hamiltonian path '
+                                                 'continues uninterrupted across the boundary.\n',
+                                  'symmetric': False,
+                                  'directional': True,
+                                  'owns_parameters': [],
+                                  'construction_methods': ['raglan_seamless',
+                                                           'circular_yoke',
+                                                           'saddle_shoulder',
+                                                           'drop_shoulder'],
+                                  'notes': 'Requires LIVE_STITCH on both sides. The canonical '
+                                           'top-down seamless join. No join-owned parameters; '
+                                           'stitch count carries over ONE_TO_ONE.\n'},
+                                 {'id': 'HELD_STITCH',
+                                  'description': 'Live stitches are placed on a stitch holder or '
+                                                 'waste yarn and returned to the needle later in '
+                                                 'construction. The held stitches re-enter as '
+                                                 'LIVE_STITCH when the second component is '
+                                                 'worked.\n',
+                                  'symmetric': False,
+                                  'directional': True,
+                                  'owns_parameters': [],
+                                  'construction_methods': ['raglan_seamless',
+                                                           'circular_yoke',
+                                                           'saddle_shoulder'],
+                                  'notes': 'Used for underarm separation in top-down construction: '
+                                           'sleeve stitches are held while the body continues, '
+                                           'then resumed for the sleeve. Stitch count is preserved '
+                                           'ONE_TO_ONE on the holder.\n'},
+                                 {'id': 'CAST_ON_JOIN',
+                                  'description': 'New stitches are cast on at the boundary. Owns '
+                                                 'the cast-on count and method. Used where '
+                                                 'construction requires introducing fresh stitches '
+                                                 'at a join point, e.g. underarm stitches in a '
+                                                 'top-down yoke.\n',
+                                  'symmetric': False,
+                                  'directional': True,
+                                  'owns_parameters': ['cast_on_count', 'cast_on_method'],
+                                  'construction_methods': ['raglan_seamless',
+                                                           'circular_yoke',
+                                                           'drop_shoulder'],
+                                  'notes': 'Source side has LIVE_STITCH; destination side is '
+                                           'CAST_ON. Arithmetic implication: ADDITIVE — '
+                                           'cast_on_count new stitches enter the live stitch '
+                                           'count. The Planner owns cast_on_count; Stitch Fillers '
+                                           'account for it but do not set it.\n'},
+                                 {'id': 'PICKUP',
+                                  'description': 'Stitches are picked up from a finished '
+                                                 '(bound-off or selvedge) edge to begin a new '
+                                                 'component or band. Owns the pickup ratio and '
+                                                 'direction.\n',
+                                  'symmetric': False,
+                                  'directional': True,
+                                  'owns_parameters': ['pickup_ratio', 'pickup_direction'],
+                                  'construction_methods': ['raglan_seamless',
+                                                           'circular_yoke',
+                                                           'set_in_sleeve',
+                                                           'saddle_shoulder',
+                                                           'saddle_shoulder_seamed',
+                                                           'drop_shoulder',
+                                                           'seamed_raglan'],
+                                  'notes': 'Applies to all known construction methods — used for '
+                                           'neckbands, button bands, and sleeve pickup '
+                                           'universally. The pickup ratio governs how many '
+                                           'stitches are created per unit of source edge length. '
+                                           'Arithmetic implication: RATIO.\n'},
+                                 {'id': 'SEAM',
+                                  'description': 'Two finished edges are joined post-construction, '
+                                                 'typically by sewing (mattress stitch) or '
+                                                 'three-needle bind-off. Symmetric: key ordering '
+                                                 'is arbitrary for standard seams.\n',
+                                  'symmetric': True,
+                                  'directional': False,
+                                  'owns_parameters': ['seam_method'],
+                                  'construction_methods': ['set_in_sleeve',
+                                                           'seamed_raglan',
+                                                           'saddle_shoulder_seamed'],
+                                  'notes': 'Standard case: (BOUND_OFF, BOUND_OFF). Three-needle '
+                                           'bind-off variant is (LIVE_STITCH, LIVE_STITCH) and is '
+                                           'CONDITIONAL in the compatibility table (condition: '
+                                           'three_needle_compatible). Arithmetic implication: '
+                                           'STRUCTURAL — two stitch sets are consumed into the '
+                                           'seam.\n'}]},
+ 'compatibility.yaml': {'version': '1.0',
+                        'entries': [{'edge_type_a': 'LIVE_STITCH',
+                                     'edge_type_b': 'LIVE_STITCH',
+                                     'join_type': 'CONTINUATION',
+                                     'result': 'VALID'},
+                                    {'edge_type_a': 'LIVE_STITCH',
+                                     'edge_type_b': 'LIVE_STITCH',
+                                     'join_type': 'HELD_STITCH',
+                                     'result': 'VALID'},
+                                    {'edge_type_a': 'LIVE_STITCH',
+                                     'edge_type_b': 'CAST_ON',
+                                     'join_type': 'CAST_ON_JOIN',
+                                     'result': 'VALID'},
+                                    {'edge_type_a': 'BOUND_OFF',
+                                     'edge_type_b': 'LIVE_STITCH',
+                                     'join_type': 'PICKUP',
+                                     'result': 'VALID'},
+                                    {'edge_type_a': 'SELVEDGE',
+                                     'edge_type_b': 'LIVE_STITCH',
+                                     'join_type': 'PICKUP',
+                                     'result': 'VALID'},
+                                    {'edge_type_a': 'BOUND_OFF',
+                                     'edge_type_b': 'BOUND_OFF',
+                                     'join_type': 'SEAM',
+                                     'result': 'VALID'},
+                                    {'edge_type_a': 'LIVE_STITCH',
+                                     'edge_type_b': 'LIVE_STITCH',
+                                     'join_type': 'SEAM',
+                                     'result': 'CONDITIONAL',
+                                     'condition_fn': 'three_needle_compatible'}]},
+ 'defaults.yaml': {'version': '1.0',
+                   'entries': [{'edge_type_a': 'LIVE_STITCH',
+                                'edge_type_b': 'CAST_ON',
+                                'join_type': 'CAST_ON_JOIN',
+                                'defaults': {'cast_on_method': 'backward_loop',
+                                             'cast_on_count': None}},
+                               {'edge_type_a': 'BOUND_OFF',
+                                'edge_type_b': 'LIVE_STITCH',
+                                'join_type': 'PICKUP',
+                                'defaults': {'pickup_ratio': '3:4',
+                                             'pickup_direction': 'right_to_left'}},
+                               {'edge_type_a': 'SELVEDGE',
+                                'edge_type_b': 'LIVE_STITCH',
+                                'join_type': 'PICKUP',
+                                'defaults': {'pickup_ratio': '2:3',
+                                             'pickup_direction': 'right_to_left'}},
+                               {'edge_type_a': 'BOUND_OFF',
+                                'edge_type_b': 'BOUND_OFF',
+                                'join_type': 'SEAM',
+                                'defaults': {'seam_method': 'mattress_stitch'}},
+                               {'edge_type_a': 'LIVE_STITCH',
+                                'edge_type_b': 'LIVE_STITCH',
+                                'join_type': 'SEAM',
+                                'defaults': {'seam_method': 'three_needle_bind_off'}}]},
+ 'arithmetic_implications.yaml': {'version': '1.0',
+                                  'entries': [{'join_type': 'CONTINUATION',
+                                               'implication': 'ONE_TO_ONE',
+                                               'notes': 'Stitch count carries over exactly from '
+                                                        'source to destination. No stitches are '
+                                                        'added, removed, or consumed.\n'},
+                                              {'join_type': 'HELD_STITCH',
+                                               'implication': 'ONE_TO_ONE',
+                                               'notes': 'Stitches move to holder; count is '
+                                                        'preserved. The Algebraic Checker tracks '
+                                                        'held stitches separately from the active '
+                                                        'needle state and reintegrates them when '
+                                                        'the held component is resumed.\n'},
+                                              {'join_type': 'CAST_ON_JOIN',
+                                               'implication': 'ADDITIVE',
+                                               'notes': 'cast_on_count new stitches enter the '
+                                                        'active stitch count at this join. The '
+                                                        'Planner owns cast_on_count; the Algebraic '
+                                                        'Checker reads it from the Join object.\n'},
+                                              {'join_type': 'PICKUP',
+                                               'implication': 'RATIO',
+                                               'notes': 'Resulting stitch count = '
+                                                        'floor(source_edge_length_in_rows × '
+                                                        'pickup_ratio). The Algebraic Checker '
+                                                        "derives the count from the source edge's "
+                                                        'row count and the pickup_ratio owned by '
+                                                        'this join.\n'},
+                                              {'join_type': 'SEAM',
+                                               'implication': 'STRUCTURAL',
+                                               'notes': 'Two stitch sets are consumed and bound '
+                                                        'together. The net live stitch count on '
+                                                        'the active needle decreases by the seamed '
+                                                        'stitch count. For three-needle bind-off, '
+                                                        'both sides are consumed '
+                                                        'simultaneously.\n'}]},
+ 'writer_dispatch.yaml': {'version': '1.0',
+                          'entries': [{'join_type': 'CONTINUATION',
+                                       'rendering_mode': 'inline',
+                                       'template_key': 'continuation_inline',
+                                       'directionality_note': False,
+                                       'notes': 'No explicit join instruction needed. The writer '
+                                                'continues pattern prose without interruption '
+                                                '(e.g. "Continue knitting in the round.").\n'},
+                                      {'join_type': 'HELD_STITCH',
+                                       'rendering_mode': 'instruction',
+                                       'template_key': 'held_stitch_block',
+                                       'directionality_note': True,
+                                       'notes': 'Emits: "Place next X sts on holder for [component '
+                                                'name]." Handedness drives left/right label on the '
+                                                'component name.\n'},
+                                      {'join_type': 'CAST_ON_JOIN',
+                                       'rendering_mode': 'instruction',
+                                       'template_key': 'cast_on_join_block',
+                                       'directionality_note': False,
+                                       'notes': 'Emits: "Using [cast_on_method], cast on X sts." '
+                                                'cast_on_count from the Join object drives X.\n'},
+                                      {'join_type': 'PICKUP',
+                                       'rendering_mode': 'instruction',
+                                       'template_key': 'pickup_block',
+                                       'directionality_note': True,
+                                       'notes': 'Emits: "Pick up and knit X sts along [edge '
+                                                'description]." Derived stitch count and '
+                                                'pickup_direction from the Join object. Handedness '
+                                                'drives left/right edge label.\n'},
+                                      {'join_type': 'SEAM',
+                                       'rendering_mode': 'header_note',
+                                       'template_key': 'seam_note',
+                                       'conditional_template_key': 'three_needle_block',
+                                       'directionality_note': False,
+                                       'notes': 'Standard case (BOUND_OFF × BOUND_OFF): emits a '
+                                                'finishing note at the relevant section header, '
+                                                'e.g. "You will seam this edge to the sleeve cap '
+                                                'when finishing." (rendering_mode: header_note, '
+                                                'template: seam_note). Three-needle bind-off '
+                                                'variant (CONDITIONAL, LIVE_STITCH × LIVE_STITCH): '
+                                                'the Writer detects this via '
+                                                'join.parameters["seam_method"] == '
+                                                '"three_needle_bind_off" and switches to '
+                                                'conditional_template_key (three_needle_block), '
+                                                'rendering as an instruction block instead.\n'}]}}
@@ -3,8 +3,14 @@ Topology registry: loads all lookup tables from YAML at startup, validates
 cross-references, and exposes a read-only query API.
 
 The registry is a module-level singleton; call get_registry() to obtain it.
-All tables are loaded and validated once at import time. Nothing writes to
-the registry after startup.
+All tables are loaded and validated once, on the first get_registry() call.
+Under ``python -O`` validation of the packaged tables is skipped (they are
+validated in CI) unless SKYKNIT_TOPOLOGY_VALIDATE=1; custom data directories
+are always validated. Nothing writes to the registry after construction.
+
+For the packaged data directory the parsed tables come from _compiled_data.py
+(generated by scripts/compile_topology_data.py) when its source digest matches
+the YAML on disk; otherwise the YAML files are parsed directly.
 
 ──────────────────────────────────────────────────────────────────────────────
 condition_fn contract
@@ -31,13 +37,27 @@ does not hold a reference to the callable.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
+import sys
 from pathlib import Path
 from types import MappingProxyType
 from typing import Any, NamedTuple, Optional, cast
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 from .types import (
+    _COMPAT_RESULT_BY_VALUE,
+    _EDGE_TYPE_BY_VALUE,
+    _IMPLICATION_BY_VALUE,
+    _JOIN_TYPE_BY_VALUE,
+    _RENDERING_MODE_BY_VALUE,
     ArithmeticEntry,
     ArithmeticImplication,
     CompatibilityEntry,
@@ -48,10 +68,59 @@ from .types import (
     JoinTypeEntry,
     RenderingMode,
     WriterDispatchEntry,
+    _member,
 )
 
 _DATA_DIR = Path(__file__).parent / "data"
 
+# Cross-reference validation of the packaged tables runs on construction
+# unless Python runs with -O and SKYKNIT_TOPOLOGY_VALIDATE is not "1".
+_VALIDATE_ON_LOAD = __debug__ or os.environ.get("SKYKNIT_TOPOLOGY_VALIDATE") == "1"
+
+# Lookup-table files in load order. scripts/compile_topology_data.py compiles
+# these into _compiled_data.py, which is used instead of parsing YAML when it
+# matches the files on disk.
+_TABLE_FILES = (
+    "edge_types.yaml",
+    "join_types.yaml",
+    "compatibility.yaml",
+    "defaults.yaml",
+    "arithmetic_implications.yaml",
+    "writer_dispatch.yaml",
+)
+
+
+class _MissingEntry(NamedTuple):
+    """Stand-in returned for absent compatibility keys (an INVALID combination)."""
+
+    result: CompatibilityResult = CompatibilityResult.INVALID
+    condition_fn: Optional[str] = None
+
+
+_MISSING_ENTRY = _MissingEntry()
+
+# Shared read-only mapping for every triple without join-owned defaults.
+_EMPTY_DEFAULTS: MappingProxyType[str, Any] = MappingProxyType({})
+
+# Shared empty levels for _compat_grid misses. Plain dicts because
+# MappingProxyType.get is slower; private and never mutated.
+_NO_ROWS: dict[EdgeType, dict[JoinType, CompatibilityResult]] = {}
+_NO_RESULTS: dict[JoinType, CompatibilityResult] = {}
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    """Intern a small-vocabulary key string from the tables; None passes through."""
+    return None if value is None else sys.intern(value)
+
+
+def _source_digest(data_dir: Path) -> str:
+    """Return a SHA-256 digest over the raw bytes of every table file in *data_dir*."""
+    digest = hashlib.sha256()
+    for filename in _TABLE_FILES:
+        digest.update(filename.encode())
+        digest.update((data_dir / filename).read_bytes())
+    return digest.hexdigest()
+
 
 class CompatibilityKey(NamedTuple):
     """
@@ -68,6 +137,10 @@ class CompatibilityKey(NamedTuple):
     join_type: JoinType
 
 
+# Plain-tuple view of a CompatibilityKey, used for query-path lookups.
+_Triple = tuple[EdgeType, EdgeType, JoinType]
+
+
 class TopologyRegistry:
     """
     Read-only registry of all topology lookup tables.
@@ -79,60 +152,129 @@ class TopologyRegistry:
     otherwise use get_registry() for the module singleton.
     """
 
-    def __init__(self, data_dir: Path = _DATA_DIR) -> None:
-        self._data_dir = data_dir
+    __slots__ = (
+        "edge_types",
+        "join_types",
+        "compatibility",
+        "defaults",
+        "arithmetic",
+        "writer_dispatch",
+        "compatibility_by_result",
+        "terminal_edges",
+        "_compat_grid",
+        "_compat_entries",
+        "_defaults_entries",
+        "_implications",
+        "_dispatch_entries",
+    )
 
+    def __init__(self, data_dir: Path = _DATA_DIR) -> None:
         # Type annotations only; actual assignment happens in _load_*
         self.edge_types: MappingProxyType[EdgeType, EdgeTypeEntry]
         self.join_types: MappingProxyType[JoinType, JoinTypeEntry]
         self.compatibility: MappingProxyType[CompatibilityKey, CompatibilityEntry]
-        self.defaults: MappingProxyType[CompatibilityKey, dict[str, Any]]
+        self.defaults: MappingProxyType[CompatibilityKey, MappingProxyType[str, Any]]
         self.arithmetic: MappingProxyType[JoinType, ArithmeticEntry]
         self.writer_dispatch: MappingProxyType[JoinType, WriterDispatchEntry]
-
-        self._load_all()
-        self._validate_cross_references()
+        # Edge types flagged is_terminal; these may never appear in compatibility.
+        self.terminal_edges: frozenset[EdgeType]
+        # Compatibility entries bucketed by result; every result has a (possibly empty) bucket.
+        self.compatibility_by_result: MappingProxyType[
+            CompatibilityResult, tuple[CompatibilityEntry, ...]
+        ]
+        # Results indexed edge_type_a → edge_type_b → join_type for get_compatibility.
+        self._compat_grid: dict[EdgeType, dict[EdgeType, dict[JoinType, CompatibilityResult]]]
+        # The plain dicts behind the compatibility/defaults proxies. Query methods
+        # look them up with bare (a, b, join) tuples: a NamedTuple key hashes and
+        # compares equal to the plain tuple, and dict.get skips the proxy hop.
+        self._compat_entries: dict[_Triple, CompatibilityEntry]
+        self._defaults_entries: dict[_Triple, MappingProxyType[str, Any]]
+        # Per-join-type lookups for get_arithmetic / get_writer_dispatch.
+        self._implications: dict[JoinType, ArithmeticImplication]
+        self._dispatch_entries: dict[JoinType, WriterDispatchEntry]
+
+        # data_dir is only needed while loading, so it is passed down, not stored.
+        self._load_all(data_dir)
+        # The packaged tables are validated in CI; custom data is always checked.
+        if _VALIDATE_ON_LOAD or data_dir != _DATA_DIR:
+            self.validate()
 
     # ── Loading ────────────────────────────────────────────────────────────────
 
-    def _load_yaml(self, filename: str) -> dict[str, Any]:
-        path = self._data_dir / filename
+    @staticmethod
+    def _load_yaml(data_dir: Path, filename: str) -> dict[str, Any]:
+        path = data_dir / filename
         try:
-            with open(path) as f:
-                return cast(dict[str, Any], yaml.safe_load(f))
+            return cast(dict[str, Any], yaml.load(path.read_bytes(), Loader=_Loader))
         except FileNotFoundError:
             raise FileNotFoundError(f"Topology data file not found: {path}") from None
         except yaml.YAMLError as exc:
             raise ValueError(f"Failed to parse topology data file {path}: {exc}") from exc
 
-    def _load_all(self) -> None:
-        self._load_edge_types()
-        self._load_join_types()
-        self._load_compatibility()
-        self._load_defaults()
-        self._load_arithmetic()
-        self._load_writer_dispatch()
+    @staticmethod
+    def _compiled_tables(data_dir: Path) -> Optional[dict[str, dict[str, Any]]]:
+        """Return the precompiled tables if they match the YAML in the data dir.
+
+        Only the packaged data directory has a compiled counterpart. Returns None
+        (fall back to YAML) if the module is missing, stale, or a file is absent.
+        """
+        if data_dir != _DATA_DIR:
+            return None
+        try:
+            from . import _compiled_data
+        except ImportError:
+            return None
+        try:
+            digest = _source_digest(data_dir)
+        except OSError:
+            return None
+        return _compiled_data.TABLES if digest == _compiled_data.SOURCE_DIGEST else None
+
+    @classmethod
+    def _from_tables(cls, tables: dict[str, dict[str, Any]]) -> TopologyRegistry:
+        """Build and validate a registry from already-parsed tables keyed by file name.
 
-    def _load_edge_types(self) -> None:
-        data = self._load_yaml("edge_types.yaml")
+        Bypasses the data directory entirely, so tests can inject a single
+        corrupted table alongside tables parsed once per session.
+        """
+        registry = cls.__new__(cls)
+        registry._load_tables(tables)
+        registry.validate()
+        return registry
+
+    def _load_all(self, data_dir: Path) -> None:
+        tables = self._compiled_tables(data_dir)
+        if tables is None:
+            tables = {filename: self._load_yaml(data_dir, filename) for filename in _TABLE_FILES}
+        self._load_tables(tables)
+
+    def _load_tables(self, tables: dict[str, dict[str, Any]]) -> None:
+        self._load_edge_types(tables["edge_types.yaml"])
+        self._load_join_types(tables["join_types.yaml"])
+        self._load_compatibility(tables["compatibility.yaml"])
+        self._load_defaults(tables["defaults.yaml"])
+        self._load_arithmetic(tables["arithmetic_implications.yaml"])
+        self._load_writer_dispatch(tables["writer_dispatch.yaml"])
+
+    def _load_edge_types(self, data: dict[str, Any]) -> None:
         result: dict[EdgeType, EdgeTypeEntry] = {}
         for entry in data["entries"]:
-            et = EdgeType(entry["id"])
+            et = _member(_EDGE_TYPE_BY_VALUE, EdgeType, entry["id"])
             result[et] = EdgeTypeEntry(
                 id=et,
                 description=entry["description"].strip(),
                 has_live_stitches=entry["has_live_stitches"],
                 is_terminal=entry["is_terminal"],
-                phase_constraint=entry["phase_constraint"],
+                phase_constraint=sys.intern(entry["phase_constraint"]),
                 notes=entry.get("notes", "").strip(),
             )
         self.edge_types = MappingProxyType(result)
+        self.terminal_edges = frozenset(et for et, entry in result.items() if entry.is_terminal)
 
-    def _load_join_types(self) -> None:
-        data = self._load_yaml("join_types.yaml")
+    def _load_join_types(self, data: dict[str, Any]) -> None:
         result: dict[JoinType, JoinTypeEntry] = {}
         for entry in data["entries"]:
-            jt = JoinType(entry["id"])
+            jt = _member(_JOIN_TYPE_BY_VALUE, JoinType, entry["id"])
             result[jt] = JoinTypeEntry(
                 id=jt,
                 description=entry["description"].strip(),
@@ -144,72 +286,91 @@ class TopologyRegistry:
             )
         self.join_types = MappingProxyType(result)
 
-    def _load_compatibility(self) -> None:
-        data = self._load_yaml("compatibility.yaml")
+    def _load_compatibility(self, data: dict[str, Any]) -> None:
         result: dict[CompatibilityKey, CompatibilityEntry] = {}
+        grid: dict[EdgeType, dict[EdgeType, dict[JoinType, CompatibilityResult]]] = {}
         for entry in data["entries"]:
             key = CompatibilityKey(
-                edge_type_a=EdgeType(entry["edge_type_a"]),
-                edge_type_b=EdgeType(entry["edge_type_b"]),
-                join_type=JoinType(entry["join_type"]),
+                edge_type_a=_member(_EDGE_TYPE_BY_VALUE, EdgeType, entry["edge_type_a"]),
+                edge_type_b=_member(_EDGE_TYPE_BY_VALUE, EdgeType, entry["edge_type_b"]),
+                join_type=_member(_JOIN_TYPE_BY_VALUE, JoinType, entry["join_type"]),
             )
             result[key] = CompatibilityEntry(
                 edge_type_a=key.edge_type_a,
                 edge_type_b=key.edge_type_b,
                 join_type=key.join_type,
-                result=CompatibilityResult(entry["result"]),
-                condition_fn=entry.get("condition_fn"),
+                result=_member(_COMPAT_RESULT_BY_VALUE, CompatibilityResult, entry["result"]),
+                condition_fn=_intern_optional(entry.get("condition_fn")),
             )
+            row = grid.setdefault(key.edge_type_a, {}).setdefault(key.edge_type_b, {})
+            row[key.join_type] = result[key].result
         self.compatibility = MappingProxyType(result)
-
-    def _load_defaults(self) -> None:
-        data = self._load_yaml("defaults.yaml")
-        result: dict[CompatibilityKey, dict[str, Any]] = {}
+        self.compatibility_by_result = MappingProxyType(
+            {
+                outcome: tuple(entry for entry in result.values() if entry.result is outcome)
+                for outcome in CompatibilityResult
+            }
+        )
+        self._compat_entries = cast(dict[_Triple, CompatibilityEntry], result)
+        self._compat_grid = grid
+
+    def _load_defaults(self, data: dict[str, Any]) -> None:
+        result: dict[CompatibilityKey, MappingProxyType[str, Any]] = {}
         for entry in data["entries"]:
             key = CompatibilityKey(
-                edge_type_a=EdgeType(entry["edge_type_a"]),
-                edge_type_b=EdgeType(entry["edge_type_b"]),
-                join_type=JoinType(entry["join_type"]),
+                edge_type_a=_member(_EDGE_TYPE_BY_VALUE, EdgeType, entry["edge_type_a"]),
+                edge_type_b=_member(_EDGE_TYPE_BY_VALUE, EdgeType, entry["edge_type_b"]),
+                join_type=_member(_JOIN_TYPE_BY_VALUE, JoinType, entry["join_type"]),
             )
-            result[key] = entry.get("defaults", {})
+            defaults = entry.get("defaults")
+            result[key] = MappingProxyType(dict(defaults)) if defaults else _EMPTY_DEFAULTS
         self.defaults = MappingProxyType(result)
+        self._defaults_entries = cast(dict[_Triple, MappingProxyType[str, Any]], result)
 
-    def _load_arithmetic(self) -> None:
-        data = self._load_yaml("arithmetic_implications.yaml")
+    def _load_arithmetic(self, data: dict[str, Any]) -> None:
         result: dict[JoinType, ArithmeticEntry] = {}
         for entry in data["entries"]:
-            jt = JoinType(entry["join_type"])
+            jt = _member(_JOIN_TYPE_BY_VALUE, JoinType, entry["join_type"])
             result[jt] = ArithmeticEntry(
                 join_type=jt,
-                implication=ArithmeticImplication(entry["implication"]),
+                implication=_member(
+                    _IMPLICATION_BY_VALUE, ArithmeticImplication, entry["implication"]
+                ),
                 notes=entry.get("notes", "").strip(),
             )
         self.arithmetic = MappingProxyType(result)
+        self._implications = {jt: entry.implication for jt, entry in result.items()}
 
-    def _load_writer_dispatch(self) -> None:
-        data = self._load_yaml("writer_dispatch.yaml")
+    def _load_writer_dispatch(self, data: dict[str, Any]) -> None:
         result: dict[JoinType, WriterDispatchEntry] = {}
         for entry in data["entries"]:
-            jt = JoinType(entry["join_type"])
+            jt = _member(_JOIN_TYPE_BY_VALUE, JoinType, entry["join_type"])
             result[jt] = WriterDispatchEntry(
                 join_type=jt,
-                rendering_mode=RenderingMode(entry["rendering_mode"]),
-                template_key=entry["template_key"],
+                rendering_mode=_member(
+                    _RENDERING_MODE_BY_VALUE, RenderingMode, entry["rendering_mode"]
+                ),
+                template_key=sys.intern(entry["template_key"]),
                 directionality_note=entry["directionality_note"],
-                conditional_template_key=entry.get("conditional_template_key"),
+                conditional_template_key=_intern_optional(entry.get("conditional_template_key")),
                 notes=entry.get("notes", "").strip(),
             )
         self.writer_dispatch = MappingProxyType(result)
+        self._dispatch_entries = result
 
     # ── Cross-reference validation ─────────────────────────────────────────────
 
-    def _validate_cross_references(self) -> None:
+    def validate(self) -> None:
         """
-        Run at startup. Raises ValueError listing all problems found if any
-        lookup table entry references a type not defined in its master registry,
-        or violates a structural invariant.
+        Check cross-references between the loaded tables.
+
+        Raises ValueError listing all problems found if any lookup table entry
+        references a type not defined in its master registry, or violates a
+        structural invariant. Run on construction unless skipped (see
+        _VALIDATE_ON_LOAD); scripts/validate_topology.py runs it explicitly.
         """
         errors: list[str] = []
+        self._check_descriptions(errors)
         self._check_compatibility_table(errors)
         self._check_join_type_completeness(errors)
         self._check_defaults_references(errors)
@@ -219,38 +380,60 @@ class TopologyRegistry:
                 + "\n".join(f"  • {e}" for e in errors)
             )
 
+    @staticmethod
+    def _entry_label(table: str, key: CompatibilityKey) -> str:
+        """Format the error prefix for a keyed entry; only called when a check fails."""
+        return (
+            f"{table} entry "
+            f"({key.edge_type_a.value}, {key.edge_type_b.value}, {key.join_type.value})"
+        )
+
     def _check_compatibility_table(self, errors: list[str]) -> None:
         """Validate all compatibility entries in a single pass.
 
         Checks: (a) referenced edge/join types exist, (b) referenced edge types
-        are not terminal, (c) CONDITIONAL entries have a condition_fn.
+        are not terminal, (c) CONDITIONAL entries, and only those, have a
+        condition_fn, (d) a condition_fn that is set is not blank.
         """
-        terminal_types = {et for et, entry in self.edge_types.items() if entry.is_terminal}
+        edge_types = self.edge_types
+        join_types = self.join_types
+        terminal_types = self.terminal_edges
         for key, entry in self.compatibility.items():
-            prefix = (
-                f"compatibility entry "
-                f"({key.edge_type_a.value}, {key.edge_type_b.value}, {key.join_type.value})"
-            )
-            if key.edge_type_a not in self.edge_types:
-                errors.append(
-                    f"{prefix}: edge_type_a {key.edge_type_a!r} is not defined in edge_types"
-                )
+            problems: list[str] = []
+            if key.edge_type_a not in edge_types:
+                problems.append(f"edge_type_a {key.edge_type_a!r} is not defined in edge_types")
             elif key.edge_type_a in terminal_types:
-                errors.append(
-                    f"{prefix}: edge_type_a {key.edge_type_a!r} is terminal and cannot appear in compatibility"
-                )
-            if key.edge_type_b not in self.edge_types:
-                errors.append(
-                    f"{prefix}: edge_type_b {key.edge_type_b!r} is not defined in edge_types"
+                problems.append(
+                    f"edge_type_a {key.edge_type_a!r} is terminal and cannot appear in compatibility"
                 )
+            if key.edge_type_b not in edge_types:
+                problems.append(f"edge_type_b {key.edge_type_b!r} is not defined in edge_types")
             elif key.edge_type_b in terminal_types:
-                errors.append(
-                    f"{prefix}: edge_type_b {key.edge_type_b!r} is terminal and cannot appear in compatibility"
+                problems.append(
+                    f"edge_type_b {key.edge_type_b!r} is terminal and cannot appear in compatibility"
                 )
-            if key.join_type not in self.join_types:
-                errors.append(f"{prefix}: join_type {key.join_type!r} is not defined in join_types")
-            if entry.result == CompatibilityResult.CONDITIONAL and not entry.condition_fn:
-                errors.append(f"{prefix}: result is CONDITIONAL but condition_fn is not set")
+            if key.join_type not in join_types:
+                problems.append(f"join_type {key.join_type!r} is not defined in join_types")
+            fn = entry.condition_fn
+            if entry.result is CompatibilityResult.CONDITIONAL:
+                if fn is None:
+                    problems.append("result is CONDITIONAL but condition_fn is not set")
+                elif not fn or fn.isspace():
+                    problems.append("condition_fn is blank")
+            elif fn is not None:
+                problems.append(f"result is {entry.result.value} but condition_fn is set")
+            if problems:
+                prefix = self._entry_label("compatibility", key)
+                errors.extend(f"{prefix}: {p}" for p in problems)
+
+    def _check_descriptions(self, errors: list[str]) -> None:
+        """Edge and join type entries must carry a non-blank description."""
+        for et, edge_entry in self.edge_types.items():
+            if not edge_entry.description:
+                errors.append(f"edge_types entry {et!r}: description is blank")
+        for jt, join_entry in self.join_types.items():
+            if not join_entry.description:
+                errors.append(f"join_types entry {jt!r}: description is blank")
 
     def _check_join_type_completeness(self, errors: list[str]) -> None:
         """Every join type must have exactly one arithmetic and one writer dispatch entry."""
@@ -262,21 +445,19 @@ class TopologyRegistry:
 
     def _check_defaults_references(self, errors: list[str]) -> None:
         """Defaults table must reference only known edge and join types."""
+        edge_types = self.edge_types
+        join_types = self.join_types
         for key in self.defaults:
-            prefix = (
-                f"defaults entry "
-                f"({key.edge_type_a.value}, {key.edge_type_b.value}, {key.join_type.value})"
-            )
-            if key.edge_type_a not in self.edge_types:
-                errors.append(
-                    f"{prefix}: edge_type_a {key.edge_type_a!r} is not defined in edge_types"
-                )
-            if key.edge_type_b not in self.edge_types:
-                errors.append(
-                    f"{prefix}: edge_type_b {key.edge_type_b!r} is not defined in edge_types"
-                )
-            if key.join_type not in self.join_types:
-                errors.append(f"{prefix}: join_type {key.join_type!r} is not defined in join_types")
+            problems: list[str] = []
+            if key.edge_type_a not in edge_types:
+                problems.append(f"edge_type_a {key.edge_type_a!r} is not defined in edge_types")
+            if key.edge_type_b not in edge_types:
+                problems.append(f"edge_type_b {key.edge_type_b!r} is not defined in edge_types")
+            if key.join_type not in join_types:
+                problems.append(f"join_type {key.join_type!r} is not defined in join_types")
+            if problems:
+                prefix = self._entry_label("defaults", key)
+                errors.extend(f"{prefix}: {p}" for p in problems)
 
     # ── Query API ──────────────────────────────────────────────────────────────
 
@@ -287,9 +468,11 @@ class TopologyRegistry:
         join_type: JoinType,
     ) -> CompatibilityResult:
         """Return VALID, CONDITIONAL, or INVALID for the ordered triple."""
-        key = CompatibilityKey(edge_type_a, edge_type_b, join_type)
-        entry = self.compatibility.get(key)
-        return entry.result if entry else CompatibilityResult.INVALID
+        return (
+            self._compat_grid.get(edge_type_a, _NO_ROWS)
+            .get(edge_type_b, _NO_RESULTS)
+            .get(join_type, CompatibilityResult.INVALID)
+        )
 
     def get_condition_fn(
         self,
@@ -298,18 +481,22 @@ class TopologyRegistry:
         join_type: JoinType,
     ) -> Optional[str]:
         """Return the condition function name for a CONDITIONAL entry, or None."""
-        key = CompatibilityKey(edge_type_a, edge_type_b, join_type)
-        entry = self.compatibility.get(key)
-        return entry.condition_fn if entry else None
+        return self._compat_entries.get(
+            (edge_type_a, edge_type_b, join_type), _MISSING_ENTRY
+        ).condition_fn
 
     def get_defaults(
         self,
         edge_type_a: EdgeType,
         edge_type_b: EdgeType,
         join_type: JoinType,
-    ) -> dict[str, Any]:
-        """Return a copy of default join-owned parameters for the given triple."""
-        return dict(self.defaults.get(CompatibilityKey(edge_type_a, edge_type_b, join_type), {}))
+    ) -> MappingProxyType[str, Any]:
+        """Return the read-only default join-owned parameters for the given triple.
+
+        The registry's own view is returned without copying; callers that need
+        to modify the parameters must take a ``dict(...)`` copy.
+        """
+        return self._defaults_entries.get((edge_type_a, edge_type_b, join_type), _EMPTY_DEFAULTS)
 
     def get_arithmetic(self, join_type: JoinType) -> ArithmeticImplication:
         """Return the arithmetic implication for the given join type.
@@ -319,7 +506,7 @@ class TopologyRegistry:
         entries after construction.
         """
         try:
-            return self.arithmetic[join_type].implication
+            return self._implications[join_type]
         except KeyError:
             raise KeyError(f"No arithmetic entry for join type {join_type!r}") from None
 
@@ -331,20 +518,20 @@ class TopologyRegistry:
         entries after construction.
         """
         try:
-            return self.writer_dispatch[join_type]
+            return self._dispatch_entries[join_type]
         except KeyError:
             raise KeyError(f"No writer dispatch entry for join type {join_type!r}") from None
 
 
 # ── Module-level singleton ─────────────────────────────────────────────────────
 #
-# Initialized eagerly at import time so there is no lazy-init race condition
-# in concurrent contexts. The registry is read-only after construction, so
-# sharing it across threads is safe.
-
-_registry: TopologyRegistry = TopologyRegistry()
+# Built lazily on the first get_registry() call, so importing the topology
+# package costs no I/O or validation. functools.cache memoizes the zero-arg
+# call without LRU bookkeeping, and the registry is read-only after
+# construction (MappingProxyType tables), so sharing it across threads is safe.
 
 
+@functools.cache
 def get_registry() -> TopologyRegistry:
-    """Return the module-level registry singleton."""
-    return _registry
+    """Return the module-level registry singleton, building it on first use."""
+    return TopologyRegistry()
@@ -9,10 +9,11 @@ runtime.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass
 from enum import Enum
 from types import MappingProxyType
-from typing import Any, Optional
+from typing import Any, Optional, TypeVar
 
 # ── Enums ──────────────────────────────────────────────────────────────────────
 
@@ -58,10 +59,39 @@ class RenderingMode(str, Enum):
     HEADER_NOTE = "header_note"
 
 
+# ── Value → member lookup ──────────────────────────────────────────────────────
+#
+# Used when converting YAML strings to enum members: a dict hit is several
+# times cheaper than Enum.__call__. Misses fall through to the enum constructor
+# so unknown values still raise the usual ValueError.
+
+_E = TypeVar("_E", bound=Enum)
+
+_EDGE_TYPE_BY_VALUE: dict[str, EdgeType] = {member.value: member for member in EdgeType}
+_JOIN_TYPE_BY_VALUE: dict[str, JoinType] = {member.value: member for member in JoinType}
+_COMPAT_RESULT_BY_VALUE: dict[str, CompatibilityResult] = {
+    member.value: member for member in CompatibilityResult
+}
+_IMPLICATION_BY_VALUE: dict[str, ArithmeticImplication] = {
+    member.value: member for member in ArithmeticImplication
+}
+_RENDERING_MODE_BY_VALUE: dict[str, RenderingMode] = {
+    member.value: member for member in RenderingMode
+}
+
+
+def _member(by_value: dict[str, _E], enum_cls: type[_E], value: Any) -> _E:
+    """Return the *enum_cls* member for *value*, raising ValueError if unknown."""
+    try:
+        return by_value[value]
+    except KeyError:
+        return enum_cls(value)
+
+
 # ── Registry entry types (frozen, loaded from YAML) ───────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EdgeTypeEntry:
     id: EdgeType
     description: str
@@ -71,7 +101,7 @@ class EdgeTypeEntry:
     notes: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JoinTypeEntry:
     id: JoinType
     description: str
@@ -82,7 +112,7 @@ class JoinTypeEntry:
     notes: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompatibilityEntry:
     edge_type_a: EdgeType
     edge_type_b: EdgeType
@@ -91,14 +121,14 @@ class CompatibilityEntry:
     condition_fn: Optional[str] = None  # only set when result is CONDITIONAL
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArithmeticEntry:
     join_type: JoinType
     implication: ArithmeticImplication
     notes: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WriterDispatchEntry:
     join_type: JoinType
     rendering_mode: RenderingMode
@@ -110,8 +140,11 @@ class WriterDispatchEntry:
 
 # ── Runtime objects ────────────────────────────────────────────────────────────
 
+# Shared default for Join.parameters; read-only, so one instance serves every join.
+_EMPTY_PARAMS: MappingProxyType[str, Any] = MappingProxyType({})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Edge:
     """A typed boundary of a component shape."""
 
@@ -121,7 +154,7 @@ class Edge:
     dimension_key: Optional[str] = None  # explicit resolver routing; None = positional fallback
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Join:
     """
     First-class connection between exactly two component edges.
@@ -136,9 +169,34 @@ class Join:
     join_type: JoinType
     edge_a_ref: str  # "component_name.edge_name"
     edge_b_ref: str  # "component_name.edge_name"
-    parameters: MappingProxyType[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    parameters: MappingProxyType[str, Any] = _EMPTY_PARAMS
 
     def __post_init__(self) -> None:
-        # Accept plain dicts at construction sites and silently promote to MappingProxyType.
-        if isinstance(self.parameters, dict):
+        # The one place plain mappings are promoted to MappingProxyType; proxies,
+        # such as registry defaults, are kept as-is.
+        if not isinstance(self.parameters, MappingProxyType):
             object.__setattr__(self, "parameters", MappingProxyType(self.parameters))
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        id: str,
+        join_type: JoinType,
+        edge_a_ref: str,
+        edge_b_ref: str,
+        parameters: Optional[Mapping[str, Any]] = None,
+    ) -> Join:
+        """
+        Build a Join from keyword arguments, defaulting *parameters* to empty.
+
+        Wrapping is left to ``__post_init__``, so joins built here and joins
+        constructed directly end up with identical ``parameters``.
+        """
+        return cls(
+            id=id,
+            join_type=join_type,
+            edge_a_ref=edge_a_ref,
+            edge_b_ref=edge_b_ref,
+            parameters=_EMPTY_PARAMS if parameters is None else parameters,  # type: ignore[arg-type]  # __post_init__ promotes to MappingProxyType
+        )
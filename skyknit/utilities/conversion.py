@@ -7,9 +7,14 @@ All functions are pure — no side effects, no state.
 
 from __future__ import annotations
 
+# MM_PER_INCH lives in types.py (Gauge derives its mm sizes from it) and is
+# re-exported here, its public home.
+from .types import MM_PER_INCH as MM_PER_INCH
 from .types import Gauge
 
-MM_PER_INCH: float = 25.4
+# The count/physical conversions below inline the inch conversion rather than
+# calling mm_to_inches/inches_to_mm: they run on every stitch count selection.
+# The operations and their order are unchanged, so results are bit-identical.
 
 
 def inches_to_mm(inches: float) -> float:
@@ -24,22 +29,22 @@ def mm_to_inches(mm: float) -> float:
 
 def physical_to_stitch_count(dimension_mm: float, gauge: Gauge) -> float:
     """Convert a physical dimension (mm) to a raw (non-integer) stitch count."""
-    return mm_to_inches(dimension_mm) * gauge.stitches_per_inch
+    return dimension_mm / MM_PER_INCH * gauge.stitches_per_inch
 
 
 def physical_to_row_count(dimension_mm: float, gauge: Gauge) -> float:
     """Convert a physical dimension (mm) to a raw (non-integer) row count."""
-    return mm_to_inches(dimension_mm) * gauge.rows_per_inch
+    return dimension_mm / MM_PER_INCH * gauge.rows_per_inch
 
 
 def stitch_count_to_physical(count: float, gauge: Gauge) -> float:
     """Convert a stitch count to a physical dimension in mm."""
-    return inches_to_mm(count / gauge.stitches_per_inch)
+    return count / gauge.stitches_per_inch * MM_PER_INCH
 
 
 def row_count_to_physical(count: float, gauge: Gauge) -> float:
     """Convert a row count to a physical dimension in mm."""
-    return inches_to_mm(count / gauge.rows_per_inch)
+    return count / gauge.rows_per_inch * MM_PER_INCH
 
 
 def physical_to_section_rows(dimension_mm: float, gauge: Gauge) -> int:
@@ -7,12 +7,51 @@ repeat divisibility and hard constraints, then selects the optimal count.
 
 from __future__ import annotations
 
+import functools
 import math
 
-from .conversion import physical_to_stitch_count
+from .conversion import MM_PER_INCH
 from .types import Gauge
 
 
+def _constraint_key(hard_constraints: list[int] | None) -> tuple[int, ...]:
+    """Normalize hard_constraints to a hashable cache key.
+
+    Order and duplicates do not affect the LCM, so equivalent lists share an entry.
+    """
+    return tuple(sorted(set(hard_constraints))) if hard_constraints else ()
+
+
+@functools.lru_cache(maxsize=4096)
+def _valid_counts(
+    raw_target: float,
+    tolerance_stitches: float,
+    stitch_repeat: int,
+    constraints: tuple[int, ...],
+) -> tuple[int, ...]:
+    if stitch_repeat < 1:
+        raise ValueError(f"stitch_repeat must be >= 1, got {stitch_repeat}")
+    if tolerance_stitches < 0:
+        raise ValueError(f"tolerance_stitches must be >= 0, got {tolerance_stitches}")
+    for c in constraints:
+        if c < 1:
+            raise ValueError(f"hard_constraints values must be >= 1, got {c}")
+
+    # Compute the effective repeat: LCM of stitch_repeat and all hard constraints
+    effective_repeat = math.lcm(stitch_repeat, *constraints) if constraints else stitch_repeat
+
+    low = raw_target - tolerance_stitches
+    high = raw_target + tolerance_stitches
+
+    # Valid counts form an arithmetic sequence: the multiples of effective_repeat
+    # from the first one >= low (and >= 1, since stitch counts must be positive)
+    # up to the last one <= high. The band edges are rounded to integers once;
+    # everything after is exact integer arithmetic (-(-a // b) is ceil(a / b)).
+    first = max(-(-math.ceil(low) // effective_repeat), 1) * effective_repeat
+    last = math.floor(high) // effective_repeat * effective_repeat
+    return tuple(range(first, last + 1, effective_repeat))
+
+
 def find_valid_counts(
     raw_target: float,
     tolerance_stitches: float,
@@ -23,6 +62,9 @@ def find_valid_counts(
     Find all integer stitch counts within the tolerance band that are
     divisible by stitch_repeat and satisfy all hard constraints.
 
+    Results are memoized on the normalized arguments; each call returns a
+    fresh list, so callers may mutate it freely.
+
     Args:
         raw_target: Non-integer raw stitch count from gauge conversion.
         tolerance_stitches: Half-width of the tolerance band in stitches.
@@ -32,35 +74,31 @@ def find_valid_counts(
     Returns:
         Sorted list of valid integer stitch counts. Empty if none found.
     """
-    if stitch_repeat < 1:
-        raise ValueError(f"stitch_repeat must be >= 1, got {stitch_repeat}")
-    if tolerance_stitches < 0:
-        raise ValueError(f"tolerance_stitches must be >= 0, got {tolerance_stitches}")
+    return list(
+        _valid_counts(
+            raw_target, tolerance_stitches, stitch_repeat, _constraint_key(hard_constraints)
+        )
+    )
 
-    constraints = hard_constraints or []
-    for c in constraints:
-        if c < 1:
-            raise ValueError(f"hard_constraints values must be >= 1, got {c}")
 
-    # Compute the effective repeat: LCM of stitch_repeat and all hard constraints
-    effective_repeat = stitch_repeat
-    for c in constraints:
-        effective_repeat = math.lcm(effective_repeat, c)
-
-    low = raw_target - tolerance_stitches
-    high = raw_target + tolerance_stitches
-
-    first = math.ceil(low / effective_repeat) * effective_repeat
-    if first < 1:
-        first = effective_repeat  # stitch counts must be positive
-
-    result: list[int] = []
-    count = first
-    while count <= high:
-        result.append(count)
-        count += effective_repeat
+@functools.lru_cache(maxsize=4096)
+def _selected_count(
+    raw_target: float,
+    tolerance_stitches: float,
+    stitch_repeat: int,
+    constraints: tuple[int, ...],
+) -> int | None:
+    valid = _valid_counts(raw_target, tolerance_stitches, stitch_repeat, constraints)
+    if len(valid) < 2:
+        return valid[0] if valid else None
 
-    return result
+    # valid is an ascending arithmetic sequence, so the closest count is one of
+    # the two neighbours bracketing raw_target (clamped to the ends).
+    last = len(valid) - 1
+    lo = min(max(math.floor((raw_target - valid[0]) / (valid[1] - valid[0])), 0), last)
+    hi = min(lo + 1, last)
+    # Prefer the larger count when equidistant
+    return valid[hi] if abs(valid[hi] - raw_target) <= abs(valid[lo] - raw_target) else valid[lo]
 
 
 def select_stitch_count(
@@ -80,12 +118,9 @@ def select_stitch_count(
         The selected stitch count, or None if no valid count exists
         (signalling that escalation is needed upstream).
     """
-    valid = find_valid_counts(raw_target, tolerance_stitches, stitch_repeat, hard_constraints)
-    if not valid:
-        return None
-
-    # Sort by distance to target, then by count descending (prefer larger on tie)
-    return min(valid, key=lambda c: (abs(c - raw_target), -c))
+    return _selected_count(
+        raw_target, tolerance_stitches, stitch_repeat, _constraint_key(hard_constraints)
+    )
 
 
 def select_stitch_count_from_physical(
@@ -112,7 +147,11 @@ def select_stitch_count_from_physical(
     Returns:
         The selected stitch count, or None if no valid count exists.
     """
-    raw_target = physical_to_stitch_count(dimension_mm, gauge)
-    # Tolerance is a length delta — same linear conversion as a dimension
-    tolerance_stitches = physical_to_stitch_count(tolerance_mm, gauge)
+    # physical_to_stitch_count inlined for both values. Tolerance is a length
+    # delta — same linear conversion as a dimension. Keep the divide-then-multiply
+    # order: folding it into one precomputed scale factor changes the last bit
+    # and can move a count across the tolerance band edge.
+    stitches_per_inch = gauge.stitches_per_inch
+    raw_target = dimension_mm / MM_PER_INCH * stitches_per_inch
+    tolerance_stitches = tolerance_mm / MM_PER_INCH * stitches_per_inch
     return select_stitch_count(raw_target, tolerance_stitches, stitch_repeat, hard_constraints)
@@ -23,7 +23,7 @@ class ShapingAction(str, Enum):
     DECREASE = "decrease"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShapingInterval:
     """A single shaping instruction: perform action every N rows, repeated M times."""
 
@@ -13,7 +13,6 @@ from __future__ import annotations
 
 from enum import Enum
 
-from .conversion import MM_PER_INCH
 from .types import Gauge
 
 _EASE_MIN: float = 0.75
@@ -30,7 +29,7 @@ class PrecisionLevel(float, Enum):
 
 def gauge_base_mm(gauge: Gauge) -> float:
     """One stitch-width in mm at the given gauge."""
-    return MM_PER_INCH / gauge.stitches_per_inch
+    return gauge.stitch_width_mm
 
 
 def calculate_tolerance_mm(
@@ -56,4 +55,6 @@ def calculate_tolerance_mm(
         raise ValueError(
             f"ease_multiplier must be in [{_EASE_MIN}, {_EASE_MAX}], got {ease_multiplier}"
         )
-    return gauge_base_mm(gauge) * ease_multiplier * precision.value
+    # PrecisionLevel members are floats; multiplying by the member directly
+    # skips the enum ``.value`` descriptor and gives the identical product.
+    return gauge.stitch_width_mm * ease_multiplier * precision
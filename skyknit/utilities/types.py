@@ -6,23 +6,30 @@ All types are frozen dataclasses with fail-fast validation in __post_init__.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+MM_PER_INCH: float = 25.4
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Gauge:
     """
     Knitting gauge: stitch and row density per inch.
 
     Both values must be strictly positive. Gauges are immutable after
     construction and safe to share across modules.
+
+    stitch_width_mm (the width of one stitch in mm) is derived in
+    __post_init__ and is not a constructor argument.
     """
 
     stitches_per_inch: float
     rows_per_inch: float
+    stitch_width_mm: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.stitches_per_inch <= 0:
             raise ValueError(f"stitches_per_inch must be positive, got {self.stitches_per_inch}")
         if self.rows_per_inch <= 0:
             raise ValueError(f"rows_per_inch must be positive, got {self.rows_per_inch}")
+        object.__setattr__(self, "stitch_width_mm", MM_PER_INCH / self.stitches_per_inch)
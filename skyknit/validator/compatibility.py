@@ -19,22 +19,35 @@ connects to another component — they are flagged as "error".
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import Enum
 
 from skyknit.schemas.manifest import ShapeManifest
 from skyknit.topology.registry import get_registry
 from skyknit.topology.types import CompatibilityResult, Edge
 
 
-@dataclass(frozen=True)
+class Severity(str, Enum):
+    """How serious a ValidationError is; only ERROR fails validation."""
+
+    ERROR = "error"
+    WARNING = "warning"
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationError:
     """A single geometric validation failure or warning."""
 
     join_id: str
     message: str
-    severity: str  # "error" | "warning"
+    severity: Severity
 
 
-def validate_edge_join_compatibility(manifest: ShapeManifest) -> list[ValidationError]:
+def validate_edge_join_compatibility(
+    manifest: ShapeManifest,
+    *,
+    edge_map: dict[str, Edge] | None = None,
+    unresolved: set[str] | None = None,
+) -> list[ValidationError]:
     """
     Check every join's edge-type combination against the topology registry.
 
@@ -42,6 +55,12 @@ def validate_edge_join_compatibility(manifest: ShapeManifest) -> list[Validation
     ----------
     manifest:
         The ShapeManifest to validate.
+    edge_map:
+        Prebuilt ``"component.edge"`` → Edge lookup for *manifest*, as
+        returned by ``_build_edge_map``; built here when omitted.
+    unresolved:
+        If given, the id of every join with an edge ref that does not resolve
+        is added to this set, so later passes can skip re-reporting it.
 
     Returns
     -------
@@ -49,7 +68,8 @@ def validate_edge_join_compatibility(manifest: ShapeManifest) -> list[Validation
     INVALID combinations have severity "error"; CONDITIONAL have "warning".
     """
     registry = get_registry()
-    edge_map = _build_edge_map(manifest)
+    if edge_map is None:
+        edge_map = _build_edge_map(manifest)
     errors: list[ValidationError] = []
 
     for join in manifest.joins:
@@ -61,23 +81,24 @@ def validate_edge_join_compatibility(manifest: ShapeManifest) -> list[Validation
                 ValidationError(
                     join_id=join.id,
                     message=f"edge_a_ref {join.edge_a_ref!r} does not resolve to a known edge",
-                    severity="error",
+                    severity=Severity.ERROR,
                 )
             )
-            continue
-
         if edge_b is None:
             errors.append(
                 ValidationError(
                     join_id=join.id,
                     message=f"edge_b_ref {join.edge_b_ref!r} does not resolve to a known edge",
-                    severity="error",
+                    severity=Severity.ERROR,
                 )
             )
+        if edge_a is None or edge_b is None:
+            if unresolved is not None:
+                unresolved.add(join.id)
             continue
 
         # Terminal edges must not be the source of a structural join
-        if registry.edge_types[edge_a.edge_type].is_terminal:
+        if edge_a.edge_type in registry.terminal_edges:
             errors.append(
                 ValidationError(
                     join_id=join.id,
@@ -85,7 +106,7 @@ def validate_edge_join_compatibility(manifest: ShapeManifest) -> list[Validation
                         f"edge_a ({join.edge_a_ref}) has terminal type "
                         f"{edge_a.edge_type.value!r} and cannot be a join source"
                     ),
-                    severity="error",
+                    severity=Severity.ERROR,
                 )
             )
             continue
@@ -104,7 +125,7 @@ def validate_edge_join_compatibility(manifest: ShapeManifest) -> list[Validation
                             f"{edge_a.edge_type.value} + {edge_b.edge_type.value} "
                             f"via {join.join_type.value}"
                         ),
-                        severity="error",
+                        severity=Severity.ERROR,
                     )
                 )
             case CompatibilityResult.CONDITIONAL:
@@ -120,7 +141,7 @@ def validate_edge_join_compatibility(manifest: ShapeManifest) -> list[Validation
                             f"via {join.join_type.value} "
                             f"(condition: {condition_fn!r} — evaluation deferred)"
                         ),
-                        severity="warning",
+                        severity=Severity.WARNING,
                     )
                 )
 
@@ -132,8 +153,8 @@ def validate_edge_join_compatibility(manifest: ShapeManifest) -> list[Validation
 
 def _build_edge_map(manifest: ShapeManifest) -> dict[str, Edge]:
     """Build a flat ``"component.edge"`` → Edge lookup from the manifest."""
-    edge_map: dict[str, Edge] = {}
-    for component in manifest.components:
-        for edge in component.edges:
-            edge_map[f"{component.name}.{edge.name}"] = edge
-    return edge_map
+    return {
+        ref: edge
+        for component in manifest.components
+        for ref, edge in zip(component.full_refs, component.edges)
+    }
@@ -13,11 +13,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from skyknit.schemas.manifest import ShapeManifest
-from skyknit.validator.compatibility import ValidationError, validate_edge_join_compatibility
+from skyknit.validator.compatibility import (
+    Severity,
+    ValidationError,
+    _build_edge_map,
+    validate_edge_join_compatibility,
+)
 from skyknit.validator.spatial import validate_spatial_coherence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Aggregate outcome of the Phase 1 Geometric Validator."""
 
@@ -35,14 +40,21 @@ def validate_phase1(manifest: ShapeManifest) -> ValidationResult:
     Returns ``ValidationResult(passed=True, errors=())`` when the manifest
     is fully valid.
     """
-    errors: list[ValidationError] = []
-    errors.extend(validate_edge_join_compatibility(manifest))
-    errors.extend(validate_spatial_coherence(manifest))
+    # Both checks resolve edge refs through the same lookup; build it once.
+    edge_map = _build_edge_map(manifest)
+    # Joins with unresolved refs are reported by the compatibility pass;
+    # spatial skips its own ref-resolution check for them to avoid duplicates.
+    unresolved: set[str] = set()
+    compatibility_errors = validate_edge_join_compatibility(
+        manifest, edge_map=edge_map, unresolved=unresolved
+    )
+    spatial_errors = validate_spatial_coherence(manifest, edge_map=edge_map, skip_joins=unresolved)
 
-    # Warnings do not cause a failure — only "error" severity does
-    failed = any(e.severity == "error" for e in errors)
+    # Warnings do not cause a failure — only "error" severity does. Spatial
+    # checks only emit errors, so only the compatibility results need scanning.
+    failed = bool(spatial_errors) or any(e.severity == Severity.ERROR for e in compatibility_errors)
 
     return ValidationResult(
         passed=not failed,
-        errors=tuple(errors),
+        errors=(*compatibility_errors, *spatial_errors),
     )
@@ -15,11 +15,19 @@ the Algebraic Checker's stitch-count layer.)
 
 from __future__ import annotations
 
+from collections.abc import Set
+
 from skyknit.schemas.manifest import ShapeManifest
-from skyknit.validator.compatibility import ValidationError
+from skyknit.topology.types import Edge
+from skyknit.validator.compatibility import Severity, ValidationError, _build_edge_map
 
 
-def validate_spatial_coherence(manifest: ShapeManifest) -> list[ValidationError]:
+def validate_spatial_coherence(
+    manifest: ShapeManifest,
+    *,
+    edge_map: dict[str, Edge] | None = None,
+    skip_joins: Set[str] = frozenset(),
+) -> list[ValidationError]:
     """
     Check referential and dimensional coherence across the ShapeManifest.
 
@@ -29,76 +37,80 @@ def validate_spatial_coherence(manifest: ShapeManifest) -> list[ValidationError]
        in the manifest (``"component.edge"`` format).
     3. Joins must not reference the same edge on both sides.
 
+    *edge_map* may be passed in when the caller has already built the
+    ``"component.edge"`` lookup for *manifest* (see ``validate_phase1``).
+    Joins named in *skip_joins* have already had their unresolved refs
+    reported by the compatibility pass, so check 2 is skipped for them.
+
+    Every problem found here has severity "error"; ``validate_phase1`` relies
+    on that to skip scanning these results.
+
     Returns a (possibly empty) list of ValidationErrors.
     """
     errors: list[ValidationError] = []
 
-    join_ids = {join.id for join in manifest.joins}
-    edge_map = _build_edge_map(manifest)
+    join_ids = manifest.join_ids
 
     # ── 1. Every join_ref on edges must point to a real join ──────────────────
-    for component in manifest.components:
-        for edge in component.edges:
-            if edge.join_ref is not None and edge.join_ref not in join_ids:
-                errors.append(
-                    ValidationError(
-                        join_id=edge.join_ref,
-                        message=(
-                            f"edge '{component.name}.{edge.name}' references join "
-                            f"{edge.join_ref!r} which does not exist in the manifest"
-                        ),
-                        severity="error",
-                    )
-                )
-
-    # ── 2. Every join's edge refs must resolve ────────────────────────────────
-    for join in manifest.joins:
-        if join.edge_a_ref not in edge_map:
+    for ref, join_ref in zip(manifest.edge_refs, manifest.edge_join_refs):
+        if join_ref is not None and join_ref not in join_ids:
             errors.append(
                 ValidationError(
-                    join_id=join.id,
+                    join_id=join_ref,
                     message=(
-                        f"join '{join.id}': edge_a_ref {join.edge_a_ref!r} "
-                        f"does not resolve to any component edge"
+                        f"edge '{ref}' references join "
+                        f"{join_ref!r} which does not exist in the manifest"
                     ),
-                    severity="error",
+                    severity=Severity.ERROR,
                 )
             )
-        if join.edge_b_ref not in edge_map:
-            errors.append(
-                ValidationError(
-                    join_id=join.id,
-                    message=(
-                        f"join '{join.id}': edge_b_ref {join.edge_b_ref!r} "
-                        f"does not resolve to any component edge"
-                    ),
-                    severity="error",
+
+    # Checks 2 and 3 are per join; without joins there is no edge map to build.
+    if not manifest.joins:
+        return errors
+    if edge_map is None:
+        edge_map = _build_edge_map(manifest)
+
+    # ── 2. Every join's edge refs must resolve ────────────────────────────────
+    for join in manifest.joins:
+        # Each ref is read up to four times below; load the attributes once.
+        edge_a_ref = join.edge_a_ref
+        edge_b_ref = join.edge_b_ref
+        if join.id not in skip_joins:
+            if edge_a_ref not in edge_map:
+                errors.append(
+                    ValidationError(
+                        join_id=join.id,
+                        message=(
+                            f"join '{join.id}': edge_a_ref {edge_a_ref!r} "
+                            f"does not resolve to any component edge"
+                        ),
+                        severity=Severity.ERROR,
+                    )
+                )
+            if edge_b_ref not in edge_map:
+                errors.append(
+                    ValidationError(
+                        join_id=join.id,
+                        message=(
+                            f"join '{join.id}': edge_b_ref {edge_b_ref!r} "
+                            f"does not resolve to any component edge"
+                        ),
+                        severity=Severity.ERROR,
+                    )
                 )
-            )
 
         # ── 3. A join must not connect an edge to itself ───────────────────────
-        if join.edge_a_ref == join.edge_b_ref:
+        if edge_a_ref == edge_b_ref:
             errors.append(
                 ValidationError(
                     join_id=join.id,
                     message=(
                         f"join '{join.id}': edge_a_ref and edge_b_ref are the same "
-                        f"({join.edge_a_ref!r}) — a join must connect two distinct edges"
+                        f"({edge_a_ref!r}) — a join must connect two distinct edges"
                     ),
-                    severity="error",
+                    severity=Severity.ERROR,
                 )
             )
 
     return errors
-
-
-# ── Helpers ───────────────────────────────────────────────────────────────────
-
-
-def _build_edge_map(manifest: ShapeManifest) -> dict[str, object]:
-    """Build a flat ``"component.edge"`` → Edge lookup."""
-    edge_map: dict[str, object] = {}
-    for component in manifest.components:
-        for edge in component.edges:
-            edge_map[f"{component.name}.{edge.name}"] = edge
-    return edge_map
@@ -0,0 +1,84 @@
+"""
+Record/replay wrapper around an Anthropic client for LLMWriter integration tests.
+
+``CassetteClient`` exposes the single call LLMWriter makes —
+``client.messages.create(**request)`` — and keys every request by the SHA-256
+of its canonical JSON encoding.  On a hit the stored response is replayed from
+``<cassette_dir>/<key>.json``; on a miss the wrapped live client is called and
+its response recorded.  With no live client a miss raises ``LookupError``, so a
+stale cassette surfaces as an LLMWriter fallback rather than a network call.
+In record mode every request goes to the live client and overwrites its
+cassette, which is how stale recordings are refreshed.
+
+Only the attributes LLMWriter reads are persisted: each content block's
+``type`` plus its ``input`` (tool_use) or ``text`` (text) payload.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+
+def cassette_key(request: dict[str, Any]) -> str:
+    """Return the SHA-256 hex digest of *request* encoded as canonical JSON."""
+    encoded = json.dumps(request, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _serialize_block(block: Any) -> dict[str, Any]:
+    data: dict[str, Any] = {"type": block.type}
+    if block.type == "tool_use":
+        data["name"] = getattr(block, "name", None)
+        data["input"] = block.input
+    elif block.type == "text":
+        data["text"] = block.text
+    return data
+
+
+class CassetteClient:
+    """Anthropic-client stand-in that replays recorded responses.
+
+    Args:
+        cassette_dir: Directory holding one ``<sha256>.json`` file per request.
+        live_client: Real ``anthropic.Anthropic()`` used to record misses, or
+            None for replay-only mode.
+        record: Call *live_client* for every request, even on a hit, and
+            overwrite the stored response.
+
+    Raises:
+        ValueError: If *record* is set without a *live_client*.
+    """
+
+    def __init__(
+        self, cassette_dir: Path, live_client: Any | None = None, *, record: bool = False
+    ) -> None:
+        if record and live_client is None:
+            raise ValueError("CassetteClient record mode needs a live client")
+        self._dir = cassette_dir
+        self._live = live_client
+        self._record = record
+
+    @property
+    def messages(self) -> CassetteClient:
+        """Mirror the ``client.messages.create`` access path of the real client."""
+        return self
+
+    def create(self, **request: Any) -> SimpleNamespace:
+        """Return the recorded response for *request*, recording it first on a miss."""
+        path = self._dir / f"{cassette_key(request)}.json"
+        if path.is_file() and not self._record:
+            blocks = json.loads(path.read_text(encoding="utf-8"))["content"]
+        elif self._live is None:
+            raise LookupError(
+                f"No recorded LLM response at {path}; re-run with ANTHROPIC_API_KEY and SKYKNIT_LLM_RECORD=1 to record it"
+            )
+        else:
+            response = self._live.messages.create(**request)
+            blocks = [_serialize_block(b) for b in response.content]
+            self._dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({"content": blocks}, indent=2) + "\n", encoding="utf-8")
+        return SimpleNamespace(content=[SimpleNamespace(**b) for b in blocks])
@@ -140,8 +140,35 @@ class TestComponentSpec:
         )
         assert isinstance(spec.dimensions, MappingProxyType)
 
+    def test_full_refs_follow_edge_order(self, body_spec):
+        assert body_spec.full_refs == ("body.top", "body.bottom")
+
+    def test_full_refs_excluded_from_equality_and_repr(self, body_spec, body_edges):
+        twin = ComponentSpec(
+            name="body",
+            shape_type=ShapeType.CYLINDER,
+            dimensions={"circumference_mm": 914.4, "depth_mm": 457.2},
+            edges=body_edges,
+            handedness=Handedness.NONE,
+            instantiation_count=1,
+        )
+        assert twin == body_spec
+        assert "full_refs" not in repr(body_spec)
+
 
 class TestShapeManifest:
+    def test_flat_edge_views_are_parallel(self, sample_manifest):
+        assert sample_manifest.edge_refs == (
+            "body.top",
+            "body.bottom",
+            "sleeve.top",
+            "sleeve.bottom",
+        )
+        assert sample_manifest.edge_join_refs == ("yoke_body_join", None, "yoke_sleeve_join", None)
+
+    def test_join_ids_derived(self, sample_manifest, sample_join):
+        assert sample_manifest.join_ids == frozenset({sample_join.id})
+
     def test_construction(self, sample_manifest, body_spec, sleeve_spec, sample_join):
         assert len(sample_manifest.components) == 2
         assert sample_manifest.components[0] == body_spec
@@ -3,6 +3,7 @@ Tests for the topology registry.
 
 Covers:
   - All YAML tables load without error
+  - The precompiled tables are current and match a fresh YAML load
   - Every enum value has a registry entry
   - Cross-reference invariants hold
   - Specific known-valid combinations return VALID
@@ -13,11 +14,12 @@ Covers:
   - Corrupted data raises at load time (not silently at query time)
 """
 
-import shutil
 from pathlib import Path
 
 import pytest
+import yaml
 
+import skyknit.topology.registry as registry_module
 from skyknit.topology import (
     ArithmeticImplication,
     CompatibilityResult,
@@ -26,16 +28,59 @@ from skyknit.topology import (
     RenderingMode,
     get_registry,
 )
-from skyknit.topology.registry import TopologyRegistry
+from skyknit.topology.registry import _TABLE_FILES, TopologyRegistry
 
 _DATA_DIR = Path(__file__).parent.parent.parent / "skyknit" / "topology" / "data"
 
 
+def _fail_validate(self):
+    raise AssertionError("validate() should not have been called")
+
+
 @pytest.fixture(scope="module")
 def registry():
     return get_registry()
 
 
+@pytest.fixture(scope="session")
+def _pristine_data():
+    """Contents of the packaged YAML tables, read once per session."""
+    return {filename: (_DATA_DIR / filename).read_bytes() for filename in _TABLE_FILES}
+
+
+@pytest.fixture
+def data_dir(tmp_path, _pristine_data):
+    """A private, writable copy of the packaged data directory for corruption tests."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for filename, content in _pristine_data.items():
+        (data_dir / filename).write_bytes(content)
+    return data_dir
+
+
+@pytest.fixture(scope="session")
+def parsed_tables(_pristine_data):
+    """The packaged tables parsed once per session; treat as read-only."""
+    return {filename: yaml.safe_load(content) for filename, content in _pristine_data.items()}
+
+
+def _triple(entry):
+    return (entry.edge_type_a, entry.edge_type_b, entry.join_type)
+
+
+def _with_extra_entry(tables, filename, entry):
+    """Return *tables* with *entry* appended to one table; the others are shared."""
+    table = tables[filename]
+    return {**tables, filename: {**table, "entries": [*table["entries"], entry]}}
+
+
+def _without_join_type(tables, filename, join_type):
+    """Return *tables* with every *join_type* entry dropped from one table."""
+    table = tables[filename]
+    entries = [e for e in table["entries"] if e["join_type"] != join_type]
+    return {**tables, filename: {**table, "entries": entries}}
+
+
 # ── Registry loads ─────────────────────────────────────────────────────────────
 
 
@@ -96,11 +141,51 @@ class TestRegistryLoads:
         for jt, entry in registry.join_types.items():
             assert entry.description, f"JoinType.{jt.value} has empty description"
 
+    def test_compiled_tables_are_current(self):
+        """_compiled_data.py must be regenerated whenever a YAML table changes."""
+        from skyknit.topology import _compiled_data
+        from skyknit.topology.registry import _source_digest
+
+        assert _compiled_data.SOURCE_DIGEST == _source_digest(_DATA_DIR), (
+            "skyknit/topology/_compiled_data.py is stale; run scripts/compile_topology_data.py"
+        )
+
+    def test_compiled_tables_match_yaml_load(self, registry, data_dir):
+        """The compiled fast path and the YAML path must build identical tables."""
+        from_yaml = TopologyRegistry(data_dir=data_dir)
+        assert from_yaml.edge_types == registry.edge_types
+        assert from_yaml.join_types == registry.join_types
+        assert from_yaml.compatibility == registry.compatibility
+        assert from_yaml.defaults == registry.defaults
+        assert from_yaml.arithmetic == registry.arithmetic
+        assert from_yaml.writer_dispatch == registry.writer_dispatch
+
+    def test_from_tables_matches_packaged_registry(self, registry, parsed_tables):
+        """Building from pre-parsed tables yields the same registry as a directory load."""
+        built = TopologyRegistry._from_tables(parsed_tables)
+        assert built.compatibility == registry.compatibility
+        assert built.defaults == registry.defaults
+
+    def test_key_strings_are_interned(self, registry, parsed_tables):
+        """Template keys from separate loads are the same interned string objects."""
+        built = TopologyRegistry._from_tables(parsed_tables)
+        for jt, entry in built.writer_dispatch.items():
+            assert entry.template_key is registry.writer_dispatch[jt].template_key
+
 
 # ── Compatibility table ────────────────────────────────────────────────────────
 
 
 class TestCompatibility:
+    def test_get_compatibility_agrees_with_table_for_every_triple(self, registry):
+        """The query index must return exactly the table's result, INVALID when absent."""
+        for eta in EdgeType:
+            for etb in EdgeType:
+                for jt in JoinType:
+                    entry = registry.compatibility.get((eta, etb, jt))
+                    expected = entry.result if entry else CompatibilityResult.INVALID
+                    assert registry.get_compatibility(eta, etb, jt) == expected
+
     @pytest.mark.parametrize(
         "eta, etb, jt",
         [
@@ -128,7 +213,7 @@ class TestCompatibility:
 
     def test_conditional_has_condition_fn(self, registry):
         fn = registry.get_condition_fn(EdgeType.LIVE_STITCH, EdgeType.LIVE_STITCH, JoinType.SEAM)
-        assert fn is not None and len(fn) > 0
+        assert fn
 
     @pytest.mark.parametrize(
         "eta, etb, jt",
@@ -157,9 +242,9 @@ class TestCompatibility:
     def test_open_is_terminal_and_absent_from_compatibility(self, registry):
         """OPEN is flagged is_terminal and must not appear in any compatibility entry."""
         assert registry.edge_types[EdgeType.OPEN].is_terminal is True
-        for eta, etb, _ in registry.compatibility:
-            assert eta != EdgeType.OPEN, "OPEN appeared as edge_type_a in compatibility"
-            assert etb != EdgeType.OPEN, "OPEN appeared as edge_type_b in compatibility"
+        assert registry.terminal_edges == {EdgeType.OPEN}
+        used = {et for key in registry.compatibility for et in key[:2]}
+        assert registry.terminal_edges.isdisjoint(used), "a terminal edge appears in compatibility"
 
     def test_open_has_live_stitches_false(self, registry):
         """OPEN has_live_stitches must be false: liveness is instance-dependent, not a type guarantee."""
@@ -229,10 +314,20 @@ class TestDefaults:
         )
         assert defaults == {}
 
-    def test_get_defaults_returns_copy(self, registry):
-        """Mutating the returned dict must not affect the registry."""
+    def test_empty_defaults_share_one_mapping(self, registry):
+        """Triples without defaults (listed or absent) return one shared empty mapping."""
+        listed = registry.get_defaults(
+            EdgeType.LIVE_STITCH, EdgeType.LIVE_STITCH, JoinType.CONTINUATION
+        )
+        absent = registry.get_defaults(EdgeType.CAST_ON, EdgeType.CAST_ON, JoinType.SEAM)
+        assert listed == {}
+        assert absent is listed
+
+    def test_get_defaults_is_read_only(self, registry):
+        """The returned mapping is the registry's read-only view; mutation raises."""
         defaults = registry.get_defaults(EdgeType.BOUND_OFF, EdgeType.BOUND_OFF, JoinType.SEAM)
-        defaults["injected"] = "should not persist"
+        with pytest.raises(TypeError):
+            defaults["injected"] = "should not persist"  # type: ignore[index]
         clean = registry.get_defaults(EdgeType.BOUND_OFF, EdgeType.BOUND_OFF, JoinType.SEAM)
         assert "injected" not in clean
 
@@ -315,11 +410,21 @@ class TestWriterDispatch:
 
 
 class TestCrossReferenceValidation:
-    def test_bad_join_type_in_compatibility_raises(self, tmp_path):
-        """A compatibility entry referencing a nonexistent join type must fail at load."""
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
+    def test_packaged_tables_skip_validation_when_disabled(self, monkeypatch):
+        """With the load-time gate off (python -O), the packaged tables are not re-validated."""
+        monkeypatch.setattr(registry_module, "_VALIDATE_ON_LOAD", False)
+        monkeypatch.setattr(TopologyRegistry, "validate", _fail_validate)
+        TopologyRegistry()
+
+    def test_custom_data_dir_always_validated(self, monkeypatch, data_dir):
+        """Custom data directories are validated even with the load-time gate off."""
+        monkeypatch.setattr(registry_module, "_VALIDATE_ON_LOAD", False)
+        monkeypatch.setattr(TopologyRegistry, "validate", _fail_validate)
+        with pytest.raises(AssertionError, match="validate"):
+            TopologyRegistry(data_dir=data_dir)
 
+    def test_bad_join_type_in_compatibility_raises(self, data_dir):
+        """A compatibility entry referencing a nonexistent join type must fail at load."""
         bad = data_dir / "compatibility.yaml"
         bad.write_text(
             bad.read_text()
@@ -333,173 +438,147 @@ class TestCrossReferenceValidation:
         with pytest.raises(ValueError):
             TopologyRegistry(data_dir=data_dir)
 
-    def test_conditional_without_condition_fn_raises(self, tmp_path):
+    def test_conditional_without_condition_fn_raises(self, parsed_tables):
         """A CONDITIONAL entry missing condition_fn must fail at load."""
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
-
-        bad = data_dir / "compatibility.yaml"
-        bad.write_text(
-            bad.read_text()
-            + (
-                "\n  - edge_type_a: BOUND_OFF\n"
-                "    edge_type_b: BOUND_OFF\n"
-                "    join_type: PICKUP\n"
-                "    result: CONDITIONAL\n"
-                # condition_fn deliberately omitted
-            )
+        tables = _with_extra_entry(
+            parsed_tables,
+            "compatibility.yaml",
+            # condition_fn deliberately omitted
+            {
+                "edge_type_a": "BOUND_OFF",
+                "edge_type_b": "BOUND_OFF",
+                "join_type": "PICKUP",
+                "result": "CONDITIONAL",
+            },
         )
         with pytest.raises(ValueError):
-            TopologyRegistry(data_dir=data_dir)
+            TopologyRegistry._from_tables(tables)
+
+    def test_blank_condition_fn_raises(self, parsed_tables):
+        """A whitespace-only condition_fn is rejected at load, not left to callers."""
+        tables = _with_extra_entry(
+            parsed_tables,
+            "compatibility.yaml",
+            {
+                "edge_type_a": "BOUND_OFF",
+                "edge_type_b": "BOUND_OFF",
+                "join_type": "PICKUP",
+                "result": "CONDITIONAL",
+                "condition_fn": "   ",
+            },
+        )
+        with pytest.raises(ValueError, match="condition_fn is blank"):
+            TopologyRegistry._from_tables(tables)
+
+    def test_condition_fn_on_valid_entry_raises(self, parsed_tables):
+        tables = _with_extra_entry(
+            parsed_tables,
+            "compatibility.yaml",
+            {
+                "edge_type_a": "BOUND_OFF",
+                "edge_type_b": "BOUND_OFF",
+                "join_type": "PICKUP",
+                "result": "VALID",
+                "condition_fn": "check_something",
+            },
+        )
+        with pytest.raises(ValueError, match="result is VALID but condition_fn is set"):
+            TopologyRegistry._from_tables(tables)
 
-    def test_terminal_edge_in_compatibility_raises(self, tmp_path):
-        """A compatibility entry referencing a terminal edge type must fail at load."""
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
+    def test_blank_description_raises(self, parsed_tables):
+        table = parsed_tables["edge_types.yaml"]
+        entries = [{**table["entries"][0], "description": "  \n"}, *table["entries"][1:]]
+        tables = {**parsed_tables, "edge_types.yaml": {**table, "entries": entries}}
+        with pytest.raises(ValueError, match="description is blank"):
+            TopologyRegistry._from_tables(tables)
 
-        bad = data_dir / "compatibility.yaml"
-        bad.write_text(
-            bad.read_text()
-            + (
-                "\n  - edge_type_a: OPEN\n"
-                "    edge_type_b: LIVE_STITCH\n"
-                "    join_type: CONTINUATION\n"
-                "    result: VALID\n"
-            )
+    def test_terminal_edge_in_compatibility_raises(self, parsed_tables):
+        """A compatibility entry referencing a terminal edge type must fail at load."""
+        tables = _with_extra_entry(
+            parsed_tables,
+            "compatibility.yaml",
+            {
+                "edge_type_a": "OPEN",
+                "edge_type_b": "LIVE_STITCH",
+                "join_type": "CONTINUATION",
+                "result": "VALID",
+            },
         )
         with pytest.raises(ValueError):
-            TopologyRegistry(data_dir=data_dir)
+            TopologyRegistry._from_tables(tables)
 
-    def test_bad_edge_type_in_defaults_raises(self, tmp_path):
+    def test_bad_edge_type_in_defaults_raises(self, parsed_tables):
         """A defaults entry referencing an unknown edge type must fail at load."""
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
-
-        bad = data_dir / "defaults.yaml"
-        bad.write_text(
-            bad.read_text()
-            + (
-                "\n  - edge_type_a: NONEXISTENT_EDGE\n"
-                "    edge_type_b: LIVE_STITCH\n"
-                "    join_type: PICKUP\n"
-                "    defaults:\n"
-                '      pickup_ratio: "3:4"\n'
-            )
+        tables = _with_extra_entry(
+            parsed_tables,
+            "defaults.yaml",
+            {
+                "edge_type_a": "NONEXISTENT_EDGE",
+                "edge_type_b": "LIVE_STITCH",
+                "join_type": "PICKUP",
+                "defaults": {"pickup_ratio": "3:4"},
+            },
         )
         with pytest.raises(ValueError):
-            TopologyRegistry(data_dir=data_dir)
+            TopologyRegistry._from_tables(tables)
 
 
 # ── YAML loading error paths ───────────────────────────────────────────────────
 
 
 class TestYAMLLoadingErrors:
-    def test_missing_edge_types_file_raises(self, tmp_path):
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
-        (data_dir / "edge_types.yaml").unlink()
-        with pytest.raises(FileNotFoundError):
-            TopologyRegistry(data_dir=data_dir)
-
-    def test_missing_join_types_file_raises(self, tmp_path):
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
-        (data_dir / "join_types.yaml").unlink()
-        with pytest.raises(FileNotFoundError):
-            TopologyRegistry(data_dir=data_dir)
-
-    def test_missing_compatibility_file_raises(self, tmp_path):
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
-        (data_dir / "compatibility.yaml").unlink()
-        with pytest.raises(FileNotFoundError):
-            TopologyRegistry(data_dir=data_dir)
-
-    def test_missing_defaults_file_raises(self, tmp_path):
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
-        (data_dir / "defaults.yaml").unlink()
-        with pytest.raises(FileNotFoundError):
-            TopologyRegistry(data_dir=data_dir)
-
-    def test_missing_arithmetic_file_raises(self, tmp_path):
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
-        (data_dir / "arithmetic_implications.yaml").unlink()
-        with pytest.raises(FileNotFoundError):
-            TopologyRegistry(data_dir=data_dir)
-
-    def test_missing_writer_dispatch_file_raises(self, tmp_path):
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
-        (data_dir / "writer_dispatch.yaml").unlink()
-        with pytest.raises(FileNotFoundError):
+    @pytest.mark.parametrize("filename", _TABLE_FILES)
+    def test_missing_file_raises(self, data_dir, filename):
+        (data_dir / filename).unlink()
+        with pytest.raises(FileNotFoundError, match=filename):
             TopologyRegistry(data_dir=data_dir)
 
-    def test_malformed_yaml_raises_value_error(self, tmp_path):
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
+    def test_malformed_yaml_raises_value_error(self, data_dir):
         (data_dir / "edge_types.yaml").write_text("entries: [\n  - id: BROKEN\n    bad: {unclosed")
         with pytest.raises(ValueError, match="Failed to parse"):
             TopologyRegistry(data_dir=data_dir)
 
-    def test_invalid_edge_type_enum_in_yaml_raises(self, tmp_path):
+    def test_invalid_edge_type_enum_in_yaml_raises(self, parsed_tables):
         """An unrecognised enum value in YAML must raise at load time."""
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
-
-        bad = data_dir / "edge_types.yaml"
-        bad.write_text(
-            bad.read_text()
-            + (
-                "\n  - id: TOTALLY_INVALID\n"
-                "    description: bad entry\n"
-                "    has_live_stitches: false\n"
-                "    is_terminal: false\n"
-                "    phase_constraint: any\n"
-            )
+        tables = _with_extra_entry(
+            parsed_tables,
+            "edge_types.yaml",
+            {
+                "id": "TOTALLY_INVALID",
+                "description": "bad entry",
+                "has_live_stitches": False,
+                "is_terminal": False,
+                "phase_constraint": "any",
+            },
         )
         with pytest.raises(ValueError):
-            TopologyRegistry(data_dir=data_dir)
-
-    def test_invalid_join_type_enum_in_arithmetic_raises(self, tmp_path):
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
+            TopologyRegistry._from_tables(tables)
 
-        bad = data_dir / "arithmetic_implications.yaml"
-        bad.write_text(
-            bad.read_text() + "\n  - join_type: NONEXISTENT\n    implication: ONE_TO_ONE\n"
+    def test_invalid_join_type_enum_in_arithmetic_raises(self, parsed_tables):
+        tables = _with_extra_entry(
+            parsed_tables,
+            "arithmetic_implications.yaml",
+            {"join_type": "NONEXISTENT", "implication": "ONE_TO_ONE"},
         )
         with pytest.raises(ValueError):
-            TopologyRegistry(data_dir=data_dir)
+            TopologyRegistry._from_tables(tables)
 
 
 # ── Join type completeness validation ─────────────────────────────────────────
 
 
 class TestJoinTypeCompletenessValidation:
-    def test_missing_arithmetic_entry_raises(self, tmp_path):
+    def test_missing_arithmetic_entry_raises(self, parsed_tables):
         """A join type with no arithmetic entry must fail cross-reference validation."""
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
-
-        # Rewrite arithmetic file with one join type missing
-        original = (data_dir / "arithmetic_implications.yaml").read_text()
-        lines = [line for line in original.splitlines(keepends=True) if "CONTINUATION" not in line]
-        (data_dir / "arithmetic_implications.yaml").write_text("".join(lines))
+        tables = _without_join_type(parsed_tables, "arithmetic_implications.yaml", "CONTINUATION")
         with pytest.raises(ValueError, match="arithmetic"):
-            TopologyRegistry(data_dir=data_dir)
+            TopologyRegistry._from_tables(tables)
 
-    def test_missing_writer_dispatch_entry_raises(self, tmp_path):
+    def test_missing_writer_dispatch_entry_raises(self, parsed_tables):
         """A join type with no writer dispatch entry must fail cross-reference validation."""
-        data_dir = tmp_path / "data"
-        shutil.copytree(_DATA_DIR, data_dir)
-
-        original = (data_dir / "writer_dispatch.yaml").read_text()
-        lines = [line for line in original.splitlines(keepends=True) if "CONTINUATION" not in line]
-        (data_dir / "writer_dispatch.yaml").write_text("".join(lines))
+        tables = _without_join_type(parsed_tables, "writer_dispatch.yaml", "CONTINUATION")
         with pytest.raises(ValueError, match="writer_dispatch"):
-            TopologyRegistry(data_dir=data_dir)
+            TopologyRegistry._from_tables(tables)
 
 
 # ── Condition function global invariant ───────────────────────────────────────
@@ -508,35 +587,24 @@ class TestJoinTypeCompletenessValidation:
 class TestConditionFnInvariant:
     def test_all_conditional_entries_have_condition_fn(self, registry):
         """Every entry with result=CONDITIONAL must carry a non-empty condition_fn."""
-        for key, entry in registry.compatibility.items():
-            if entry.result == CompatibilityResult.CONDITIONAL:
-                assert entry.condition_fn is not None and len(entry.condition_fn) > 0, (
-                    f"CONDITIONAL entry {key} has no condition_fn"
-                )
-
-    def test_no_valid_entry_has_condition_fn(self, registry):
-        """VALID entries must never carry a condition_fn."""
-        for key, entry in registry.compatibility.items():
-            if entry.result == CompatibilityResult.VALID:
-                assert entry.condition_fn is None, (
-                    f"VALID entry {key} unexpectedly has condition_fn={entry.condition_fn!r}"
-                )
-
-    def test_no_invalid_entry_has_condition_fn(self, registry):
-        """INVALID entries must never carry a condition_fn."""
-        for key, entry in registry.compatibility.items():
-            if entry.result == CompatibilityResult.INVALID:
-                assert entry.condition_fn is None, (
-                    f"INVALID entry {key} unexpectedly has condition_fn={entry.condition_fn!r}"
-                )
+        for entry in registry.compatibility_by_result[CompatibilityResult.CONDITIONAL]:
+            assert entry.condition_fn, f"CONDITIONAL entry {_triple(entry)} has no condition_fn"
+
+    @pytest.mark.parametrize("result", [CompatibilityResult.VALID, CompatibilityResult.INVALID])
+    def test_non_conditional_entries_have_no_condition_fn(self, registry, result):
+        """VALID and INVALID entries must never carry a condition_fn."""
+        for entry in registry.compatibility_by_result[result]:
+            assert entry.condition_fn is None, (
+                f"{result.value} entry {_triple(entry)} unexpectedly has "
+                f"condition_fn={entry.condition_fn!r}"
+            )
 
-    def test_condition_fn_is_non_empty_string(self, registry):
-        """condition_fn values must be non-empty strings, not empty string placeholders."""
-        for key, entry in registry.compatibility.items():
-            if entry.condition_fn is not None:
-                assert isinstance(entry.condition_fn, str) and entry.condition_fn.strip(), (
-                    f"condition_fn for {key} is blank or not a string"
-                )
+    def test_compatibility_by_result_partitions_the_table(self, registry):
+        buckets = registry.compatibility_by_result
+        assert set(buckets) == set(CompatibilityResult)
+        assert sum(len(bucket) for bucket in buckets.values()) == len(registry.compatibility)
+        for result, bucket in buckets.items():
+            assert all(entry.result is result for entry in bucket)
 
 
 # ── Cross-table consistency ────────────────────────────────────────────────────
@@ -568,9 +636,8 @@ class TestCrossTableConsistency:
         """A join type should only expose conditional_template_key if a CONDITIONAL
         compatibility entry exists for that join type."""
         join_types_with_conditional = {
-            key.join_type
-            for key, entry in registry.compatibility.items()
-            if entry.result == CompatibilityResult.CONDITIONAL
+            entry.join_type
+            for entry in registry.compatibility_by_result[CompatibilityResult.CONDITIONAL]
         }
         for jt, entry in registry.writer_dispatch.items():
             if entry.conditional_template_key is not None:
@@ -98,11 +98,14 @@ class TestJoin:
         assert join.parameters["cast_on_count"] == 8
         assert join.parameters["cast_on_method"] == "backward_loop"
 
-    def test_parameters_are_independent_between_instances(self):
-        """Two joins with default parameters must not share the same proxy object."""
+    def test_default_parameters_share_one_read_only_mapping(self):
+        """Defaulted joins share a single empty proxy, which cannot be mutated through."""
         join_a = Join(id="j1", join_type=JoinType.CONTINUATION, edge_a_ref="a.e", edge_b_ref="b.e")
         join_b = Join(id="j2", join_type=JoinType.CONTINUATION, edge_a_ref="c.e", edge_b_ref="d.e")
-        assert join_a.parameters is not join_b.parameters
+        assert join_a.parameters is join_b.parameters
+        with pytest.raises(TypeError):
+            join_a.parameters["cast_on_count"] = 8  # type: ignore[index]
+        assert join_b.parameters == {}
 
     def test_join_is_frozen(self):
         join = Join(
@@ -137,6 +140,35 @@ class TestJoin:
         assert isinstance(join.parameters, MappingProxyType)
         assert join.parameters["cast_on_count"] == 12
 
+    def test_create_wraps_plain_dict_parameters(self):
+        join = Join.create(
+            id="j1",
+            join_type=JoinType.CAST_ON_JOIN,
+            edge_a_ref="a.e",
+            edge_b_ref="b.e",
+            parameters={"cast_on_count": 12},
+        )
+        assert isinstance(join.parameters, MappingProxyType)
+        assert join.parameters["cast_on_count"] == 12
+
+    def test_create_passes_proxy_parameters_through(self):
+        """An existing MappingProxyType (e.g. registry defaults) is shared, not re-wrapped."""
+        proxy = MappingProxyType({"seam_method": "mattress"})
+        join = Join.create(
+            id="j1",
+            join_type=JoinType.SEAM,
+            edge_a_ref="a.bound_off",
+            edge_b_ref="b.bound_off",
+            parameters=proxy,
+        )
+        assert join.parameters is proxy
+
+    def test_create_defaults_to_empty_parameters(self):
+        join = Join.create(
+            id="j1", join_type=JoinType.CONTINUATION, edge_a_ref="a.e", edge_b_ref="b.e"
+        )
+        assert join.parameters == {}
+
     def test_all_join_types_accepted(self):
         for jt in JoinType:
             join = Join(id=f"j_{jt.value}", join_type=jt, edge_a_ref="a.e", edge_b_ref="b.e")
@@ -358,6 +390,4 @@ class TestJoinTypeEntryFields:
 
     def test_all_join_types_have_construction_methods(self, registry):
         for jt, entry in registry.join_types.items():
-            assert len(entry.construction_methods) > 0, (
-                f"{jt.value}: construction_methods must not be empty"
-            )
+            assert entry.construction_methods, f"{jt.value}: construction_methods must not be empty"
@@ -92,12 +92,32 @@ class TestFindValidCounts:
         r2 = find_valid_counts(100.0, 5.0, 4)
         assert len(r2) > 0
 
+    def test_constraint_order_and_duplicates_do_not_matter(self):
+        assert find_valid_counts(100.0, 25.0, 4, hard_constraints=[6, 5]) == find_valid_counts(
+            100.0, 25.0, 4, hard_constraints=[5, 6, 5]
+        )
+
+    def test_validation_repeats_on_every_call(self):
+        """Memoization must not swallow errors on a second identical call."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="stitch_repeat must be >= 1"):
+                find_valid_counts(100.0, 5.0, 0)
+
     def test_low_target_near_zero(self):
         """Counts must be positive even if tolerance band extends below zero."""
         result = find_valid_counts(2.0, 5.0, 3)
         # Range [-3, 7], multiples of 3 > 0: 3, 6
         assert result == [3, 6]
 
+    def test_band_entirely_below_zero(self):
+        result = find_valid_counts(-10.0, 2.0, 1)
+        assert result == []
+
+    def test_wide_band_includes_both_endpoints(self):
+        """Endpoints that are exact multiples are inclusive: [0, 1000] → 1..1000."""
+        result = find_valid_counts(500.0, 500.0, 1)
+        assert result == list(range(1, 1001))
+
 
 class TestSelectStitchCount:
     def test_selects_closest_to_target(self):
@@ -142,6 +162,11 @@ class TestSelectStitchCount:
         result = select_stitch_count(100.0, 1.0, 4)
         assert result == 100
 
+    def test_wide_band_tie_prefers_larger(self):
+        """Valid [60, 64, ..., 136]; 98 sits midway between 96 and 100 → picks 100."""
+        result = select_stitch_count(98.0, 40.0, 4)
+        assert result == 100
+
 
 class TestSelectStitchCountFromPhysical:
     """End-to-end pipeline: physical dimension → selected stitch count."""
@@ -48,3 +48,11 @@ class TestGauge:
         # Can be used as dict key
         d = {g: "worsted"}
         assert d[g] == "worsted"
+
+    def test_derived_stitch_width_mm(self):
+        assert Gauge(stitches_per_inch=5.0, rows_per_inch=8.0).stitch_width_mm == pytest.approx(
+            5.08
+        )
+
+    def test_derived_mm_sizes_not_in_repr(self):
+        assert repr(Gauge(5.0, 7.0)) == "Gauge(stitches_per_inch=5.0, rows_per_inch=7.0)"
@@ -0,0 +1,52 @@
+"""Manifest builders and assertion helpers shared by the validator test modules."""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Iterable
+from types import MappingProxyType
+
+from skyknit.schemas.manifest import ComponentSpec, Handedness, ShapeManifest, ShapeType
+from skyknit.topology.types import Edge, EdgeType, Join, JoinType
+from skyknit.validator.compatibility import ValidationError
+
+# Read-only, so every spec built here can share the one mapping.
+_DIMS = MappingProxyType({"circumference_mm": 914.4, "depth_mm": 457.2})
+
+
+def spec(name: str, edges: tuple) -> ComponentSpec:
+    """Return a single-instance cylinder component with *edges*."""
+    # Positional arguments: these factories run for nearly every validator test.
+    return ComponentSpec(name, ShapeType.CYLINDER, _DIMS, edges, Handedness.NONE, 1)
+
+
+# Edges and joins are frozen and built from hashable arguments, so identical
+# requests across the suite can share one instance.
+@functools.cache
+def live_edge(name: str, join_ref: str | None = None) -> Edge:
+    """Return a LIVE_STITCH edge, optionally bound to *join_ref*."""
+    return Edge(name, EdgeType.LIVE_STITCH, join_ref)
+
+
+@functools.cache
+def join(
+    join_id: str, edge_a: str, edge_b: str, join_type: JoinType = JoinType.CONTINUATION
+) -> Join:
+    """Return a join between two ``"component.edge"`` refs (CONTINUATION by default)."""
+    return Join(join_id, join_type, edge_a, edge_b)
+
+
+def yoke_body_manifest() -> ShapeManifest:
+    """Return the canonical valid manifest: yoke.bottom → body.top via CONTINUATION j1."""
+    return ShapeManifest(
+        components=(
+            spec("yoke", (live_edge("bottom", "j1"),)),
+            spec("body", (live_edge("top", "j1"),)),
+        ),
+        joins=(join("j1", "yoke.bottom", "body.top"),),
+    )
+
+
+def messages(errors: Iterable[ValidationError]) -> str:
+    """Return every error message joined by newlines, for substring assertions."""
+    return "\n".join(e.message for e in errors)
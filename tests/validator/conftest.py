@@ -0,0 +1,19 @@
+"""Shared fixtures for the validator test package."""
+
+from __future__ import annotations
+
+import pytest
+
+from skyknit.schemas.manifest import ShapeManifest
+
+from ._factories import yoke_body_manifest
+
+
+@pytest.fixture(scope="session")
+def base_manifest() -> ShapeManifest:
+    """The canonical valid yoke/body manifest, built once per session.
+
+    ShapeManifest and everything it holds are frozen, so every test that
+    only needs a coherent manifest can share one instance.
+    """
+    return yoke_body_manifest()
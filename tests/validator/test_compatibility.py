@@ -2,56 +2,35 @@
 
 from __future__ import annotations
 
-from skyknit.schemas.manifest import ComponentSpec, Handedness, ShapeManifest, ShapeType
-from skyknit.topology.types import Edge, EdgeType, Join, JoinType
-from skyknit.validator.compatibility import ValidationError, validate_edge_join_compatibility
-
-# ── Fixture helpers ────────────────────────────────────────────────────────────
+from dataclasses import FrozenInstanceError
 
+import pytest
 
-def _spec(name: str, edges: tuple) -> ComponentSpec:
-    return ComponentSpec(
-        name=name,
-        shape_type=ShapeType.CYLINDER,
-        dimensions={"circumference_mm": 914.4, "depth_mm": 457.2},
-        edges=edges,
-        handedness=Handedness.NONE,
-        instantiation_count=1,
-    )
-
+from skyknit.schemas.manifest import ShapeManifest
+from skyknit.topology.types import Edge, EdgeType, Join, JoinType
+from skyknit.validator.compatibility import (
+    Severity,
+    ValidationError,
+    validate_edge_join_compatibility,
+)
 
-def _join(join_id: str, join_type: JoinType, edge_a: str, edge_b: str) -> Join:
-    return Join(
-        id=join_id,
-        join_type=join_type,
-        edge_a_ref=edge_a,
-        edge_b_ref=edge_b,
-    )
+from ._factories import join, live_edge, spec
 
 
 class TestValidCombinations:
-    def test_live_stitch_continuation_passes(self):
+    def test_live_stitch_continuation_passes(self, base_manifest):
         """LIVE_STITCH + LIVE_STITCH via CONTINUATION → VALID."""
-        manifest = ShapeManifest(
-            components=(
-                _spec(
-                    "yoke", (Edge(name="bottom", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)
-                ),
-                _spec("body", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
-            ),
-            joins=(_join("j1", JoinType.CONTINUATION, "yoke.bottom", "body.top"),),
-        )
-        errors = validate_edge_join_compatibility(manifest)
+        errors = validate_edge_join_compatibility(base_manifest)
         assert errors == []
 
     def test_bound_off_pickup_passes(self):
         """BOUND_OFF + LIVE_STITCH via PICKUP → VALID."""
         manifest = ShapeManifest(
             components=(
-                _spec("body", (Edge(name="side", edge_type=EdgeType.BOUND_OFF, join_ref="j1"),)),
-                _spec("band", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
+                spec("body", (Edge(name="side", edge_type=EdgeType.BOUND_OFF, join_ref="j1"),)),
+                spec("band", (live_edge("top", "j1"),)),
             ),
-            joins=(_join("j1", JoinType.PICKUP, "body.side", "band.top"),),
+            joins=(join("j1", "body.side", "band.top", JoinType.PICKUP),),
         )
         errors = validate_edge_join_compatibility(manifest)
         assert errors == []
@@ -60,10 +39,10 @@ class TestValidCombinations:
         """BOUND_OFF + BOUND_OFF via SEAM → VALID."""
         manifest = ShapeManifest(
             components=(
-                _spec("left", (Edge(name="side", edge_type=EdgeType.BOUND_OFF, join_ref="j1"),)),
-                _spec("right", (Edge(name="side", edge_type=EdgeType.BOUND_OFF, join_ref="j1"),)),
+                spec("left", (Edge(name="side", edge_type=EdgeType.BOUND_OFF, join_ref="j1"),)),
+                spec("right", (Edge(name="side", edge_type=EdgeType.BOUND_OFF, join_ref="j1"),)),
             ),
-            joins=(_join("j1", JoinType.SEAM, "left.side", "right.side"),),
+            joins=(join("j1", "left.side", "right.side", JoinType.SEAM),),
         )
         errors = validate_edge_join_compatibility(manifest)
         assert errors == []
@@ -76,7 +55,7 @@ class TestValidCombinations:
     def test_no_joins_passes(self):
         manifest = ShapeManifest(
             components=(
-                _spec("body", (Edge(name="bottom", edge_type=EdgeType.BOUND_OFF, join_ref=None),)),
+                spec("body", (Edge(name="bottom", edge_type=EdgeType.BOUND_OFF, join_ref=None),)),
             ),
             joins=(),
         )
@@ -89,10 +68,10 @@ class TestInvalidCombinations:
         """CAST_ON + LIVE_STITCH via CONTINUATION is not in the table → INVALID."""
         manifest = ShapeManifest(
             components=(
-                _spec("a", (Edge(name="top", edge_type=EdgeType.CAST_ON, join_ref="j1"),)),
-                _spec("b", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
+                spec("a", (Edge(name="top", edge_type=EdgeType.CAST_ON, join_ref="j1"),)),
+                spec("b", (live_edge("top", "j1"),)),
             ),
-            joins=(_join("j1", JoinType.CONTINUATION, "a.top", "b.top"),),
+            joins=(join("j1", "a.top", "b.top", JoinType.CONTINUATION),),
         )
         errors = validate_edge_join_compatibility(manifest)
         assert len(errors) == 1
@@ -102,10 +81,10 @@ class TestInvalidCombinations:
     def test_error_message_contains_edge_types(self):
         manifest = ShapeManifest(
             components=(
-                _spec("a", (Edge(name="top", edge_type=EdgeType.CAST_ON, join_ref="j1"),)),
-                _spec("b", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
+                spec("a", (Edge(name="top", edge_type=EdgeType.CAST_ON, join_ref="j1"),)),
+                spec("b", (live_edge("top", "j1"),)),
             ),
-            joins=(_join("j1", JoinType.CONTINUATION, "a.top", "b.top"),),
+            joins=(join("j1", "a.top", "b.top", JoinType.CONTINUATION),),
         )
         errors = validate_edge_join_compatibility(manifest)
         assert "CAST_ON" in errors[0].message or "LIVE_STITCH" in errors[0].message
@@ -116,10 +95,10 @@ class TestConditionalCombinations:
         """LIVE_STITCH + LIVE_STITCH via SEAM → CONDITIONAL → warning."""
         manifest = ShapeManifest(
             components=(
-                _spec("front", (Edge(name="side", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
-                _spec("back", (Edge(name="side", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
+                spec("front", (live_edge("side", "j1"),)),
+                spec("back", (live_edge("side", "j1"),)),
             ),
-            joins=(_join("j1", JoinType.SEAM, "front.side", "back.side"),),
+            joins=(join("j1", "front.side", "back.side", JoinType.SEAM),),
         )
         errors = validate_edge_join_compatibility(manifest)
         assert len(errors) == 1
@@ -129,10 +108,10 @@ class TestConditionalCombinations:
     def test_conditional_message_mentions_condition(self):
         manifest = ShapeManifest(
             components=(
-                _spec("front", (Edge(name="side", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
-                _spec("back", (Edge(name="side", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
+                spec("front", (live_edge("side", "j1"),)),
+                spec("back", (live_edge("side", "j1"),)),
             ),
-            joins=(_join("j1", JoinType.SEAM, "front.side", "back.side"),),
+            joins=(join("j1", "front.side", "back.side", JoinType.SEAM),),
         )
         errors = validate_edge_join_compatibility(manifest)
         assert "condition" in errors[0].message.lower() or "deferred" in errors[0].message.lower()
@@ -143,10 +122,10 @@ class TestTerminalEdges:
         """OPEN is terminal — it must not be edge_a of any join."""
         manifest = ShapeManifest(
             components=(
-                _spec("sleeve", (Edge(name="cuff", edge_type=EdgeType.OPEN, join_ref="j1"),)),
-                _spec("body", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
+                spec("sleeve", (Edge(name="cuff", edge_type=EdgeType.OPEN, join_ref="j1"),)),
+                spec("body", (live_edge("top", "j1"),)),
             ),
-            joins=(_join("j1", JoinType.CONTINUATION, "sleeve.cuff", "body.top"),),
+            joins=(join("j1", "sleeve.cuff", "body.top", JoinType.CONTINUATION),),
         )
         errors = validate_edge_join_compatibility(manifest)
         assert len(errors) == 1
@@ -157,9 +136,7 @@ class TestTerminalEdges:
 class TestMissingEdges:
     def test_unresolvable_edge_a_ref_returns_error(self):
         manifest = ShapeManifest(
-            components=(
-                _spec("body", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
-            ),
+            components=(spec("body", (live_edge("top", "j1"),)),),
             joins=(
                 Join(
                     id="j1",
@@ -175,11 +152,7 @@ class TestMissingEdges:
 
     def test_unresolvable_edge_b_ref_returns_error(self):
         manifest = ShapeManifest(
-            components=(
-                _spec(
-                    "yoke", (Edge(name="bottom", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)
-                ),
-            ),
+            components=(spec("yoke", (live_edge("bottom", "j1"),)),),
             joins=(
                 Join(
                     id="j1",
@@ -193,16 +166,33 @@ class TestMissingEdges:
         assert len(errors) == 1
         assert "ghost.top" in errors[0].message
 
+    def test_both_refs_unresolvable_reported_and_collected(self):
+        manifest = ShapeManifest(
+            components=(),
+            joins=(
+                Join(
+                    id="j1",
+                    join_type=JoinType.CONTINUATION,
+                    edge_a_ref="a.top",
+                    edge_b_ref="b.top",
+                ),
+            ),
+        )
+        unresolved: set[str] = set()
+        errors = validate_edge_join_compatibility(manifest, unresolved=unresolved)
+        assert [e.message for e in errors] == [
+            "edge_a_ref 'a.top' does not resolve to a known edge",
+            "edge_b_ref 'b.top' does not resolve to a known edge",
+        ]
+        assert unresolved == {"j1"}
+
 
 class TestReturnType:
-    def test_returns_list_of_validation_errors(self):
-        manifest = ShapeManifest(components=(), joins=())
-        result = validate_edge_join_compatibility(manifest)
-        assert isinstance(result, list)
-
     def test_validation_error_is_frozen(self):
-        err = ValidationError(join_id="j1", message="test", severity="error")
-        import pytest
-
-        with pytest.raises(Exception):
+        err = ValidationError(join_id="j1", message="test", severity=Severity.ERROR)
+        with pytest.raises(FrozenInstanceError):
             err.message = "changed"  # type: ignore[misc]
+
+    def test_severity_compares_equal_to_its_string_value(self):
+        assert Severity.ERROR == "error"
+        assert Severity.WARNING == "warning"
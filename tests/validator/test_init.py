@@ -0,0 +1,20 @@
+"""Tests for validator public API — exports and the return types of each check."""
+
+import skyknit.validator as validator
+from skyknit.schemas.manifest import ShapeManifest
+from skyknit.validator.compatibility import validate_edge_join_compatibility
+from skyknit.validator.spatial import validate_spatial_coherence
+
+
+class TestPublicAPI:
+    def test_all_names_importable(self):
+        """Every name in __all__ is actually importable from the package."""
+        for name in validator.__all__:
+            assert hasattr(validator, name), f"{name!r} in __all__ but not importable"
+
+    def test_api_contract(self):
+        """Each check returns its documented container type, even for an empty manifest."""
+        empty = ShapeManifest(components=(), joins=())
+        assert isinstance(validate_edge_join_compatibility(empty), list)
+        assert isinstance(validate_spatial_coherence(empty), list)
+        assert isinstance(validator.validate_phase1(empty), validator.ValidationResult)
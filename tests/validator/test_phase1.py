@@ -2,58 +2,38 @@
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
-from skyknit.schemas.manifest import ComponentSpec, Handedness, ShapeManifest, ShapeType
+import skyknit.validator.compatibility as compatibility_module
+import skyknit.validator.phase1 as phase1_module
+import skyknit.validator.spatial as spatial_module
+from skyknit.schemas.manifest import ShapeManifest
 from skyknit.topology.types import Edge, EdgeType, Join, JoinType
-from skyknit.validator.compatibility import ValidationError
+from skyknit.validator.compatibility import Severity, ValidationError
 from skyknit.validator.phase1 import ValidationResult, validate_phase1
 
-
-def _spec(name: str, edges: tuple) -> ComponentSpec:
-    return ComponentSpec(
-        name=name,
-        shape_type=ShapeType.CYLINDER,
-        dimensions={"circumference_mm": 914.4, "depth_mm": 457.2},
-        edges=edges,
-        handedness=Handedness.NONE,
-        instantiation_count=1,
-    )
+from ._factories import join, live_edge, messages, spec
 
 
 class TestValidationResult:
     def test_is_frozen(self):
         result = ValidationResult(passed=True, errors=())
-        with pytest.raises(Exception):
+        with pytest.raises(FrozenInstanceError):
             result.passed = False  # type: ignore[misc]
 
     def test_warnings_do_not_fail(self):
         """A result with only warnings should still pass."""
-        warning = ValidationError(join_id="j1", message="conditional", severity="warning")
+        warning = ValidationError(join_id="j1", message="conditional", severity=Severity.WARNING)
         result = ValidationResult(passed=True, errors=(warning,))
         assert result.passed is True
 
 
 class TestValidManifest:
-    def test_valid_manifest_passes(self):
+    def test_valid_manifest_passes(self, base_manifest):
         """LIVE_STITCH → LIVE_STITCH via CONTINUATION with correct refs → pass."""
-        manifest = ShapeManifest(
-            components=(
-                _spec(
-                    "yoke", (Edge(name="bottom", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)
-                ),
-                _spec("body", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
-            ),
-            joins=(
-                Join(
-                    id="j1",
-                    join_type=JoinType.CONTINUATION,
-                    edge_a_ref="yoke.bottom",
-                    edge_b_ref="body.top",
-                ),
-            ),
-        )
-        result = validate_phase1(manifest)
+        result = validate_phase1(base_manifest)
         assert result.passed is True
         assert result.errors == ()
 
@@ -61,9 +41,23 @@ class TestValidManifest:
         result = validate_phase1(ShapeManifest(components=(), joins=()))
         assert result.passed is True
 
-    def test_returns_validation_result_type(self):
-        result = validate_phase1(ShapeManifest(components=(), joins=()))
-        assert isinstance(result, ValidationResult)
+    def test_edge_map_built_once_and_shared(self, base_manifest, monkeypatch):
+        """Both checks reuse the lookup validate_phase1 builds instead of rebuilding it."""
+        calls: list[ShapeManifest] = []
+        real_build = phase1_module._build_edge_map
+
+        def counting_build(manifest):
+            calls.append(manifest)
+            return real_build(manifest)
+
+        def fail_build(manifest):
+            raise AssertionError("edge map rebuilt inside a Phase 1 check")
+
+        monkeypatch.setattr(phase1_module, "_build_edge_map", counting_build)
+        monkeypatch.setattr(compatibility_module, "_build_edge_map", fail_build)
+        monkeypatch.setattr(spatial_module, "_build_edge_map", fail_build)
+        assert validate_phase1(base_manifest).passed is True
+        assert calls == [base_manifest]
 
 
 class TestCompatibilityErrors:
@@ -71,8 +65,8 @@ class TestCompatibilityErrors:
         """CAST_ON + LIVE_STITCH via CONTINUATION → INVALID → error."""
         manifest = ShapeManifest(
             components=(
-                _spec("a", (Edge(name="top", edge_type=EdgeType.CAST_ON, join_ref="j1"),)),
-                _spec("b", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
+                spec("a", (Edge(name="top", edge_type=EdgeType.CAST_ON, join_ref="j1"),)),
+                spec("b", (live_edge("top", "j1"),)),
             ),
             joins=(
                 Join(
@@ -87,8 +81,8 @@ class TestCompatibilityErrors:
     def test_terminal_edge_as_source_fails(self):
         manifest = ShapeManifest(
             components=(
-                _spec("sleeve", (Edge(name="cuff", edge_type=EdgeType.OPEN, join_ref="j1"),)),
-                _spec("body", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
+                spec("sleeve", (Edge(name="cuff", edge_type=EdgeType.OPEN, join_ref="j1"),)),
+                spec("body", (live_edge("top", "j1"),)),
             ),
             joins=(
                 Join(
@@ -106,16 +100,12 @@ class TestCompatibilityErrors:
 class TestSpatialErrors:
     def test_dangling_join_ref_fails(self):
         manifest = ShapeManifest(
-            components=(
-                _spec(
-                    "body", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="missing"),)
-                ),
-            ),
+            components=(spec("body", (live_edge("top", "missing"),)),),
             joins=(),
         )
         result = validate_phase1(manifest)
         assert result.passed is False
-        assert any("missing" in e.message for e in result.errors)
+        assert "missing" in messages(result.errors)
 
     def test_join_with_bad_edge_ref_fails(self):
         manifest = ShapeManifest(
@@ -129,23 +119,10 @@ class TestSpatialErrors:
         result = validate_phase1(manifest)
         assert result.passed is False
 
-
-class TestCombinedErrors:
-    def test_errors_from_both_checks_collected(self):
-        """Compatibility error + spatial error both appear in result."""
-        # CAST_ON + LIVE_STITCH via CONTINUATION → compat error
-        # Plus a dangling join_ref on a separate edge → spatial error
+    def test_bad_edge_ref_reported_once(self):
+        """Spatial skips ref resolution for joins compatibility already flagged."""
         manifest = ShapeManifest(
-            components=(
-                _spec(
-                    "a",
-                    (
-                        Edge(name="top", edge_type=EdgeType.CAST_ON, join_ref="j1"),
-                        Edge(name="side", edge_type=EdgeType.LIVE_STITCH, join_ref="nonexistent"),
-                    ),
-                ),
-                _spec("b", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
-            ),
+            components=(),
             joins=(
                 Join(
                     id="j1", join_type=JoinType.CONTINUATION, edge_a_ref="a.top", edge_b_ref="b.top"
@@ -153,15 +130,51 @@ class TestCombinedErrors:
             ),
         )
         result = validate_phase1(manifest)
-        assert result.passed is False
-        assert len(result.errors) >= 2
+        assert len(result.errors) == 2
+        text = messages(result.errors)
+        assert text.count("a.top") == 1
+        assert text.count("b.top") == 1
+
+
+@pytest.fixture(scope="class")
+def combined_result() -> ValidationResult:
+    """One run over a manifest with a compatibility error and a spatial error."""
+    # CAST_ON + LIVE_STITCH via CONTINUATION → compat error
+    # Plus a dangling join_ref on a separate edge → spatial error
+    manifest = ShapeManifest(
+        components=(
+            spec(
+                "a",
+                (
+                    Edge(name="top", edge_type=EdgeType.CAST_ON, join_ref="j1"),
+                    live_edge("side", "nonexistent"),
+                ),
+            ),
+            spec("b", (live_edge("top", "j1"),)),
+        ),
+        joins=(join("j1", "a.top", "b.top"),),
+    )
+    return validate_phase1(manifest)
+
+
+class TestCombinedErrors:
+    def test_errors_from_both_checks_collected(self, combined_result):
+        """Compatibility error + spatial error both appear in result."""
+        assert combined_result.passed is False
+        assert len(combined_result.errors) >= 2
+
+    def test_compatibility_error_present(self, combined_result):
+        assert "CAST_ON" in messages(combined_result.errors)
+
+    def test_spatial_error_present(self, combined_result):
+        assert any(e.join_id == "nonexistent" for e in combined_result.errors)
 
     def test_warnings_alone_do_not_fail(self):
         """CONDITIONAL combination → warning only → passed=True."""
         manifest = ShapeManifest(
             components=(
-                _spec("front", (Edge(name="side", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
-                _spec("back", (Edge(name="side", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
+                spec("front", (live_edge("side", "j1"),)),
+                spec("back", (live_edge("side", "j1"),)),
             ),
             joins=(
                 Join(
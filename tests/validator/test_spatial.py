@@ -2,43 +2,19 @@
 
 from __future__ import annotations
 
-from skyknit.schemas.manifest import ComponentSpec, Handedness, ShapeManifest, ShapeType
-from skyknit.topology.types import Edge, EdgeType, Join, JoinType
-from skyknit.validator.spatial import validate_spatial_coherence
-
-
-def _spec(name: str, edges: tuple) -> ComponentSpec:
-    return ComponentSpec(
-        name=name,
-        shape_type=ShapeType.CYLINDER,
-        dimensions={"circumference_mm": 914.4, "depth_mm": 457.2},
-        edges=edges,
-        handedness=Handedness.NONE,
-        instantiation_count=1,
-    )
+import pytest
 
+import skyknit.validator.spatial as spatial_module
+from skyknit.schemas.manifest import ShapeManifest
+from skyknit.topology.types import Edge, EdgeType
+from skyknit.validator.spatial import validate_spatial_coherence
 
-def _join(join_id: str, edge_a: str, edge_b: str) -> Join:
-    return Join(
-        id=join_id,
-        join_type=JoinType.CONTINUATION,
-        edge_a_ref=edge_a,
-        edge_b_ref=edge_b,
-    )
+from ._factories import join, live_edge, messages, spec
 
 
 class TestValidManifest:
-    def test_coherent_manifest_passes(self):
-        manifest = ShapeManifest(
-            components=(
-                _spec(
-                    "yoke", (Edge(name="bottom", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)
-                ),
-                _spec("body", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
-            ),
-            joins=(_join("j1", "yoke.bottom", "body.top"),),
-        )
-        errors = validate_spatial_coherence(manifest)
+    def test_coherent_manifest_passes(self, base_manifest):
+        errors = validate_spatial_coherence(base_manifest)
         assert errors == []
 
     def test_empty_manifest_passes(self):
@@ -48,7 +24,7 @@ class TestValidManifest:
     def test_no_joins_no_join_refs_passes(self):
         manifest = ShapeManifest(
             components=(
-                _spec("body", (Edge(name="bottom", edge_type=EdgeType.BOUND_OFF, join_ref=None),)),
+                spec("body", (Edge(name="bottom", edge_type=EdgeType.BOUND_OFF, join_ref=None),)),
             ),
             joins=(),
         )
@@ -56,81 +32,85 @@ class TestValidManifest:
         assert errors == []
 
 
-class TestDanglingJoinRef:
-    def test_edge_join_ref_pointing_to_missing_join(self):
-        """An edge's join_ref names a join that isn't in the manifest."""
-        manifest = ShapeManifest(
+# Each case is a manifest with exactly one kind of spatial problem, plus a
+# substring the resulting error message must contain.
+_ERROR_CASES = [
+    pytest.param(
+        ShapeManifest(
             components=(
-                _spec(
+                spec(
                     "body",
-                    (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="missing_join"),),
+                    (live_edge("top", "missing_join"),),
                 ),
             ),
             joins=(),  # no joins at all
-        )
+        ),
+        "missing_join",
+        id="edge_join_ref_pointing_to_missing_join",
+    ),
+    pytest.param(
+        ShapeManifest(
+            components=(spec("body", (live_edge("top", "j1"),)),),
+            joins=(join("j1", "ghost.bottom", "body.top"),),
+        ),
+        "ghost.bottom",
+        id="edge_a_ref_not_in_manifest",
+    ),
+    pytest.param(
+        ShapeManifest(
+            components=(spec("yoke", (live_edge("bottom", "j1"),)),),
+            joins=(join("j1", "yoke.bottom", "phantom.top"),),
+        ),
+        "phantom.top",
+        id="edge_b_ref_not_in_manifest",
+    ),
+    pytest.param(
+        ShapeManifest(
+            components=(spec("body", (live_edge("side", "j1"),)),),
+            joins=(join("j1", "body.side", "body.side"),),
+        ),
+        "distinct",
+        id="join_connecting_edge_to_itself",
+    ),
+]
+
+
+class TestSpatialErrors:
+    @pytest.mark.parametrize("manifest, needle", _ERROR_CASES)
+    def test_reports_error(self, manifest, needle):
         errors = validate_spatial_coherence(manifest)
-        assert len(errors) >= 1
-        assert any("missing_join" in e.message for e in errors)
+        assert needle in messages(errors)
         assert all(e.severity == "error" for e in errors)
 
     def test_none_join_ref_is_fine(self):
         """join_ref=None means no join — this should not be flagged."""
         manifest = ShapeManifest(
             components=(
-                _spec("body", (Edge(name="bottom", edge_type=EdgeType.BOUND_OFF, join_ref=None),)),
+                spec("body", (Edge(name="bottom", edge_type=EdgeType.BOUND_OFF, join_ref=None),)),
             ),
             joins=(),
         )
         errors = validate_spatial_coherence(manifest)
         assert errors == []
 
-
-class TestJoinReferencingNonExistentEdge:
-    def test_edge_a_ref_not_in_manifest(self):
-        manifest = ShapeManifest(
-            components=(
-                _spec("body", (Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
-            ),
-            joins=(_join("j1", "ghost.bottom", "body.top"),),
-        )
-        errors = validate_spatial_coherence(manifest)
-        assert any("ghost.bottom" in e.message for e in errors)
-
-    def test_edge_b_ref_not_in_manifest(self):
-        manifest = ShapeManifest(
-            components=(
-                _spec(
-                    "yoke", (Edge(name="bottom", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)
-                ),
-            ),
-            joins=(_join("j1", "yoke.bottom", "phantom.top"),),
-        )
-        errors = validate_spatial_coherence(manifest)
-        assert any("phantom.top" in e.message for e in errors)
-
     def test_both_refs_missing_produces_two_errors(self):
         manifest = ShapeManifest(
             components=(),
-            joins=(_join("j1", "a.top", "b.bottom"),),
+            joins=(join("j1", "a.top", "b.bottom"),),
         )
         errors = validate_spatial_coherence(manifest)
         assert len(errors) == 2
 
 
-class TestSelfJoin:
-    def test_join_connecting_edge_to_itself_is_error(self):
+class TestNoJoins:
+    def test_edge_map_not_built_without_joins(self, monkeypatch):
+        def fail_build(manifest):
+            raise AssertionError("edge map built for a manifest with no joins")
+
+        monkeypatch.setattr(spatial_module, "_build_edge_map", fail_build)
         manifest = ShapeManifest(
-            components=(
-                _spec("body", (Edge(name="side", edge_type=EdgeType.LIVE_STITCH, join_ref="j1"),)),
-            ),
-            joins=(_join("j1", "body.side", "body.side"),),
+            components=(spec("body", (live_edge("top", "gone"),)),),
+            joins=(),
         )
         errors = validate_spatial_coherence(manifest)
-        assert any("same" in e.message.lower() or "distinct" in e.message.lower() for e in errors)
-        assert any(e.severity == "error" for e in errors)
-
-
-class TestReturnType:
-    def test_returns_list(self):
-        result = validate_spatial_coherence(ShapeManifest(components=(), joins=()))
-        assert isinstance(result, list)
+        assert [e.join_id for e in errors] == ["gone"]
@@ -0,0 +1,39 @@
+"""Frozen input constants shared by the writer test modules and conftest."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+from skyknit.fabric.module import FabricInput
+from skyknit.schemas.constraint import StitchMotif, YarnSpec
+from skyknit.schemas.proportion import PrecisionPreference, ProportionSpec
+from skyknit.utilities.types import Gauge
+
+GAUGE = Gauge(stitches_per_inch=20.0, rows_per_inch=28.0)
+MOTIF = StitchMotif(name="stockinette", stitch_repeat=1, row_repeat=1)
+YARN = YarnSpec(weight="DK", fiber="wool", needle_size_mm=4.0)
+
+PROPORTION = ProportionSpec(
+    ratios=MappingProxyType({"body_ease": 1.08, "sleeve_ease": 1.1, "wrist_ease": 1.05}),
+    precision=PrecisionPreference.MEDIUM,
+)
+
+FABRIC = FabricInput(
+    component_names=(),
+    gauge=GAUGE,
+    stitch_motif=MOTIF,
+    yarn_spec=YARN,
+    precision=PrecisionPreference.MEDIUM,
+)
+
+MEASUREMENTS_DROP = MappingProxyType(
+    {
+        "chest_circumference_mm": 914.4,
+        "body_length_mm": 457.2,
+        "sleeve_length_mm": 495.3,
+        "upper_arm_circumference_mm": 381.0,
+        "wrist_circumference_mm": 152.4,
+    }
+)
+
+MEASUREMENTS_YOKE = MappingProxyType({**MEASUREMENTS_DROP, "yoke_depth_mm": 228.6})
@@ -0,0 +1,68 @@
+"""Shared fixtures for the writer test package."""
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+import skyknit.planner.garments  # noqa: F401 — registers built-in garments once per worker
+from skyknit.orchestrator.pipeline import DeterministicOrchestrator, OrchestratorInput
+from skyknit.planner.garments.registry import get
+from skyknit.writer.writer import TemplateWriter, WriterInput, WriterOutput
+
+from ._fixtures import FABRIC, MEASUREMENTS_DROP, PROPORTION
+
+
+@pytest.fixture(scope="session")
+def drop_shoulder_writer_input() -> WriterInput:
+    """WriterInput for the drop-shoulder pullover, built once per session.
+
+    Tests only read from it, so one orchestrator run is shared by every test
+    that needs the drop-shoulder topology.
+    """
+    oi = OrchestratorInput(
+        garment_spec=get("top-down-drop-shoulder-pullover"),
+        proportion_spec=PROPORTION,
+        measurements=dict(MEASUREMENTS_DROP),
+        fabric_input=FABRIC,
+    )
+    out = DeterministicOrchestrator().run(oi)
+    return WriterInput(manifest=out.manifest, irs=out.irs, component_order=out.component_order)
+
+
+@pytest.fixture(scope="session")
+def template_out_drop_shoulder(drop_shoulder_writer_input: WriterInput) -> WriterOutput:
+    """TemplateWriter output for the drop-shoulder pullover (LLM fallback oracle)."""
+    return TemplateWriter().write(drop_shoulder_writer_input)
+
+
+@pytest.fixture(scope="session")
+def anthropic_stub():
+    """Install one minimal anthropic stub in sys.modules for the whole session.
+
+    LLMWriter imports anthropic inside __init__, so the stub only needs to be
+    present while writers are constructed.  Unit tests replace the resulting
+    client with a per-test mock; live integration runs drop the stub again so
+    the real package is imported.
+    """
+    mock_anthropic = MagicMock()
+    mock_anthropic.Anthropic.return_value = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "anthropic", mock_anthropic)
+        yield mock_anthropic
+
+
+@pytest.fixture(scope="session")
+def template_writer() -> TemplateWriter:
+    """TemplateWriter instance shared by read-only checks."""
+    return TemplateWriter()
+
+
+@pytest.fixture(scope="session")
+def llm_writer(anthropic_stub):
+    """LLMWriter constructed once under the anthropic stub, for read-only checks."""
+    from skyknit.writer.llm_writer import LLMWriter
+
+    return LLMWriter()
@@ -0,0 +1,95 @@
+"""Tests for skyknit/writer/_llm_cassette.py — cassette_key and CassetteClient."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from skyknit.writer._llm_cassette import CassetteClient, cassette_key
+
+_REQUEST = {
+    "model": "m",
+    "max_tokens": 10,
+    "messages": [{"role": "user", "content": "Cast on 80 stitches."}],
+}
+_BLOCKS = [
+    {"type": "tool_use", "name": "write_knitting_pattern", "input": {"sections": {"body": "B"}}},
+    {"type": "text", "text": "done"},
+]
+
+
+class _FakeLiveClient:
+    """Stand-in for anthropic.Anthropic() that counts messages.create calls."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict] = []
+        self.messages = self
+
+    def create(self, **request):
+        self.requests.append(request)
+        return SimpleNamespace(
+            content=[
+                SimpleNamespace(type="tool_use", name="write_knitting_pattern", input={"x": 1}),
+                SimpleNamespace(type="text", text="hello"),
+            ]
+        )
+
+
+class TestCassetteKey:
+    def test_stable_across_dict_key_order(self):
+        reordered = {"messages": _REQUEST["messages"], "max_tokens": 10, "model": "m"}
+        assert cassette_key(reordered) == cassette_key(_REQUEST)
+
+    def test_differs_when_request_differs(self):
+        assert cassette_key({**_REQUEST, "max_tokens": 11}) != cassette_key(_REQUEST)
+
+
+class TestCassetteClient:
+    def test_hit_returns_stored_blocks(self, tmp_path):
+        path = tmp_path / f"{cassette_key(_REQUEST)}.json"
+        path.write_text(json.dumps({"content": _BLOCKS}), encoding="utf-8")
+        live = _FakeLiveClient()
+
+        response = CassetteClient(tmp_path, live).messages.create(**_REQUEST)
+
+        assert [vars(b) for b in response.content] == _BLOCKS
+        assert live.requests == []
+
+    def test_miss_with_live_client_calls_once_and_records(self, tmp_path):
+        live = _FakeLiveClient()
+        client = CassetteClient(tmp_path / "new", live)
+
+        first = client.messages.create(**_REQUEST)
+        second = client.messages.create(**_REQUEST)
+
+        assert live.requests == [_REQUEST]
+        recorded = json.loads((tmp_path / "new" / f"{cassette_key(_REQUEST)}.json").read_text())
+        assert recorded["content"] == [
+            {"type": "tool_use", "name": "write_knitting_pattern", "input": {"x": 1}},
+            {"type": "text", "text": "hello"},
+        ]
+        assert [vars(b) for b in first.content] == recorded["content"]
+        assert [vars(b) for b in second.content] == recorded["content"]
+
+    def test_miss_without_live_client_raises(self, tmp_path):
+        with pytest.raises(LookupError, match="No recorded LLM response"):
+            CassetteClient(tmp_path).messages.create(**_REQUEST)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_record_mode_calls_live_client_and_overwrites_hit(self, tmp_path):
+        path = tmp_path / f"{cassette_key(_REQUEST)}.json"
+        path.write_text(json.dumps({"content": _BLOCKS}), encoding="utf-8")
+        live = _FakeLiveClient()
+
+        response = CassetteClient(tmp_path, live, record=True).messages.create(**_REQUEST)
+
+        assert live.requests == [_REQUEST]
+        recorded = json.loads(path.read_text())["content"]
+        assert recorded != _BLOCKS
+        assert [vars(b) for b in response.content] == recorded
+
+    def test_record_mode_without_live_client_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="needs a live client"):
+            CassetteClient(tmp_path, record=True)
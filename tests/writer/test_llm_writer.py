@@ -2,212 +2,156 @@
 Tests for skyknit/writer/llm_writer.py — LLMWriter.
 
 Unit tests (CI-safe) mock the anthropic client via unittest.mock so no real
-API calls are made.  Integration tests require ANTHROPIC_API_KEY and are
-skipped in CI.
+API calls are made.  Integration tests replay recorded responses from
+fixtures/llm_cassettes/, and run against the live API as ``slow`` tests when
+ANTHROPIC_API_KEY is set.
 """
 
 from __future__ import annotations
 
 import os
+import re
 import sys
-from types import MappingProxyType
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
-import skyknit.planner.garments  # noqa: F401 — triggers garment registration
-from skyknit.fabric.module import FabricInput
-from skyknit.orchestrator.pipeline import DeterministicOrchestrator, OrchestratorInput
-from skyknit.planner.garments.registry import get
-from skyknit.schemas.constraint import StitchMotif, YarnSpec
-from skyknit.schemas.proportion import PrecisionPreference, ProportionSpec
-from skyknit.utilities.types import Gauge
-from skyknit.writer.writer import PatternWriter, WriterInput, WriterOutput
+from skyknit.writer.writer import WriterOutput
+
+from ._fixtures import GAUGE, MOTIF, YARN
 
 # ── Shared fixtures ────────────────────────────────────────────────────────────
 
-_GAUGE = Gauge(stitches_per_inch=20.0, rows_per_inch=28.0)
-_MOTIF = StitchMotif(name="stockinette", stitch_repeat=1, row_repeat=1)
-_YARN = YarnSpec(weight="DK", fiber="wool", needle_size_mm=4.0)
-
-_PROPORTION = ProportionSpec(
-    ratios=MappingProxyType({"body_ease": 1.08, "sleeve_ease": 1.1, "wrist_ease": 1.05}),
-    precision=PrecisionPreference.MEDIUM,
-)
-_FABRIC = FabricInput(
-    component_names=(),
-    gauge=_GAUGE,
-    stitch_motif=_MOTIF,
-    yarn_spec=_YARN,
-    precision=PrecisionPreference.MEDIUM,
-)
-_MEASUREMENTS = {
-    "chest_circumference_mm": 914.4,
-    "body_length_mm": 457.2,
-    "sleeve_length_mm": 495.3,
-    "upper_arm_circumference_mm": 381.0,
-    "wrist_circumference_mm": 152.4,
-}
-
-
-def _drop_shoulder_writer_input() -> WriterInput:
-    oi = OrchestratorInput(
-        garment_spec=get("top-down-drop-shoulder-pullover"),
-        proportion_spec=_PROPORTION,
-        measurements=_MEASUREMENTS,
-        fabric_input=_FABRIC,
-    )
-    out = DeterministicOrchestrator().run(oi)
-    return WriterInput(manifest=out.manifest, irs=out.irs, component_order=out.component_order)
+_PARTIAL_TEXT = "LLM-enhanced body only"
+_SECTION_MARKER = re.compile(r"SECTION_\d+")
 
 
 def _make_mock_client(sections: dict[str, str]) -> MagicMock:
     """Return a mock anthropic.Anthropic() that yields a tool_use block with given sections."""
-    tool_block = MagicMock()
-    tool_block.type = "tool_use"
-    tool_block.input = {"sections": sections}
-    response = MagicMock()
-    response.content = [tool_block]
-    client = MagicMock()
+    tool_block = SimpleNamespace(type="tool_use", input={"sections": sections})
+    response = SimpleNamespace(content=[tool_block])
+    client = MagicMock()  # MagicMock only here — tests inspect messages.create.call_args
     client.messages.create.return_value = response
     return client
 
 
-def _make_llm_writer_with_mock(sections: dict[str, str], **kwargs):
-    """Instantiate LLMWriter with a mocked anthropic client."""
-    from skyknit.writer.llm_writer import LLMWriter
+def _client_with_empty_content() -> MagicMock:
+    """Return a mock client whose response carries no tool_use block."""
+    client = MagicMock()
+    client.messages.create.return_value = SimpleNamespace(content=[])
+    return client
 
-    with _patch_anthropic():
-        writer = LLMWriter(**kwargs)
-    writer._client = _make_mock_client(sections)
-    return writer
 
+def _client_raising(exc: Exception) -> MagicMock:
+    """Return a mock client whose messages.create raises *exc*."""
+    client = MagicMock()
+    client.messages.create.side_effect = exc
+    return client
 
-def _patch_anthropic():
-    """Context manager that injects a minimal anthropic stub into sys.modules."""
-    import contextlib
 
-    @contextlib.contextmanager
-    def _ctx():
-        mock_anthropic = MagicMock()
-        mock_anthropic.Anthropic.return_value = MagicMock()
-        original = sys.modules.get("anthropic")  # save before any mutation
-        sys.modules["anthropic"] = mock_anthropic
-        try:
-            yield mock_anthropic
-        finally:
-            if original is None:
-                sys.modules.pop("anthropic", None)
-            else:
-                sys.modules["anthropic"] = original
+def _make_llm_writer_with_client(client: MagicMock, **kwargs):
+    """Instantiate LLMWriter (under the session anthropic stub) with *client* swapped in."""
+    from skyknit.writer.llm_writer import LLMWriter
+
+    writer = LLMWriter(**kwargs)
+    writer._client = client
+    return writer
 
-    return _ctx()
+
+def _make_llm_writer_with_mock(sections: dict[str, str], **kwargs):
+    """Instantiate LLMWriter with a mocked client returning *sections*."""
+    return _make_llm_writer_with_client(_make_mock_client(sections), **kwargs)
 
 
 # ── TestLLMWriter ──────────────────────────────────────────────────────────────
 
 
+@pytest.mark.usefixtures("anthropic_stub")
 class TestLLMWriter:
-    def _wi(self) -> WriterInput:
-        return _drop_shoulder_writer_input()
-
-    def test_write_returns_writer_output(self):
-        wi = self._wi()
+    def test_write_returns_writer_output(self, drop_shoulder_writer_input):
+        wi = drop_shoulder_writer_input
         enhanced = {name: f"Enhanced section: {name}" for name in wi.component_order}
         writer = _make_llm_writer_with_mock(enhanced)
         out = writer.write(wi)
         assert isinstance(out, WriterOutput)
 
-    def test_all_sections_present(self):
-        wi = self._wi()
+    def test_all_sections_present(self, drop_shoulder_writer_input):
+        wi = drop_shoulder_writer_input
         enhanced = {name: f"Enhanced: {name}" for name in wi.component_order}
         writer = _make_llm_writer_with_mock(enhanced)
         out = writer.write(wi)
         assert set(out.sections.keys()) == set(wi.component_order)
 
-    def test_component_order_preserved_in_full_pattern(self):
-        wi = self._wi()
+    def test_component_order_preserved_in_full_pattern(self, drop_shoulder_writer_input):
+        wi = drop_shoulder_writer_input
         # Each section has a unique marker matching its position
         enhanced = {name: f"SECTION_{i}" for i, name in enumerate(wi.component_order)}
         writer = _make_llm_writer_with_mock(enhanced)
         out = writer.write(wi)
-        positions = [out.full_pattern.index(f"SECTION_{i}") for i in range(len(wi.component_order))]
-        assert positions == sorted(positions)
-
-    def test_missing_section_falls_back_to_template(self):
-        """If LLM omits a section, template prose is used for that section."""
-        from skyknit.writer.writer import TemplateWriter
-
-        wi = self._wi()
-        template_out = TemplateWriter().write(wi)
-        # LLM returns only the first section
+        # One regex pass collects every marker in the order it appears.
+        markers = [m.group() for m in _SECTION_MARKER.finditer(out.full_pattern)]
+        assert markers == [f"SECTION_{i}" for i in range(len(wi.component_order))]
+
+    @pytest.mark.parametrize(
+        "make_client, llm_first, warns",
+        [
+            # LLM returns only the first section; the rest fall back per-section.
+            pytest.param(
+                lambda first: _make_mock_client({first: _PARTIAL_TEXT}),
+                True,
+                False,
+                id="partial_sections",
+            ),
+            # No tool_use block in the response → whole TemplateWriter output.
+            pytest.param(lambda _: _client_with_empty_content(), False, False, id="no_tool_block"),
+            # API call raises → TemplateWriter output plus a UserWarning.
+            pytest.param(
+                lambda _: _client_raising(RuntimeError("network error")),
+                False,
+                True,
+                id="api_exception",
+            ),
+        ],
+    )
+    def test_fallback_paths(
+        self, drop_shoulder_writer_input, template_out_drop_shoulder, make_client, llm_first, warns
+    ):
+        """Every LLM failure mode falls back to template prose for the affected sections."""
+        wi = drop_shoulder_writer_input
         first = wi.component_order[0]
-        partial = {first: "LLM-enhanced body only"}
-        writer = _make_llm_writer_with_mock(partial)
-        out = writer.write(wi)
-        # First section: LLM version
-        assert out.sections[first] == "LLM-enhanced body only"
-        # Remaining sections: template version
-        for name in wi.component_order[1:]:
-            assert out.sections[name] == template_out.sections[name]
-
-    def test_no_tool_block_falls_back_to_template(self):
-        """If Claude returns no tool_use block, return TemplateWriter output."""
-        from skyknit.writer.writer import TemplateWriter
-
-        wi = self._wi()
-        response = MagicMock()
-        response.content = []  # no tool_use block
-        client = MagicMock()
-        client.messages.create.return_value = response
-
-        with _patch_anthropic():
-            from skyknit.writer.llm_writer import LLMWriter
-
-            writer = LLMWriter()
-        writer._client = client
-
-        out = writer.write(wi)
-        template_out = TemplateWriter().write(wi)
-        assert out.full_pattern == template_out.full_pattern
-
-    def test_api_exception_falls_back_to_template(self):
-        """If the API call raises, return TemplateWriter output with a warning."""
-        from skyknit.writer.writer import TemplateWriter
-
-        wi = self._wi()
-        client = MagicMock()
-        client.messages.create.side_effect = RuntimeError("network error")
-
-        with _patch_anthropic():
-            from skyknit.writer.llm_writer import LLMWriter
-
-            writer = LLMWriter()
-        writer._client = client
-
-        with pytest.warns(UserWarning, match="LLMWriter failed"):
+        writer = _make_llm_writer_with_client(make_client(first))
+        if warns:
+            with pytest.warns(UserWarning, match="LLMWriter failed"):
+                out = writer.write(wi)
+        else:
             out = writer.write(wi)
-        template_out = TemplateWriter().write(wi)
-        assert out.full_pattern == template_out.full_pattern
 
-    def test_context_included_when_gauge_provided(self):
+        expected = dict(template_out_drop_shoulder.sections)
+        if llm_first:
+            expected[first] = _PARTIAL_TEXT
+        else:
+            assert out.full_pattern == template_out_drop_shoulder.full_pattern
+        assert out.sections == expected
+
+    def test_context_included_when_gauge_provided(self, drop_shoulder_writer_input):
         """Gauge context must appear in the user message when gauge is set."""
-        wi = self._wi()
+        wi = drop_shoulder_writer_input
         enhanced = {name: f"Enhanced: {name}" for name in wi.component_order}
-        writer = _make_llm_writer_with_mock(enhanced, gauge=_GAUGE)
+        writer = _make_llm_writer_with_mock(enhanced, gauge=GAUGE)
         writer.write(wi)
         call_kwargs = writer._client.messages.create.call_args
         user_content = call_kwargs[1]["messages"][0]["content"]
         assert "20.0 stitches" in user_content
         assert "28.0 rows" in user_content
 
-    def test_no_context_when_none_passed(self):
+    def test_no_context_when_none_passed(
+        self, drop_shoulder_writer_input, template_out_drop_shoulder
+    ):
         """No context prefix when gauge, motif, and yarn are all None."""
-        from skyknit.writer.writer import TemplateWriter
-
-        wi = self._wi()
-        template_out = TemplateWriter().write(wi)
-        enhanced = {name: template_out.sections[name] for name in wi.component_order}
+        wi = drop_shoulder_writer_input
+        enhanced = {name: template_out_drop_shoulder.sections[name] for name in wi.component_order}
         writer = _make_llm_writer_with_mock(enhanced)  # no gauge/motif/yarn
         writer.write(wi)
         call_kwargs = writer._client.messages.create.call_args
@@ -215,58 +159,108 @@ class TestLLMWriter:
         # User message should start directly with pattern text (first section header)
         assert user_content.startswith(wi.component_order[0].replace("_", " ").title())
 
-    def test_llm_writer_satisfies_pattern_writer_protocol(self):
-        with _patch_anthropic():
-            from skyknit.writer.llm_writer import LLMWriter
+    def test_import_error_without_anthropic(self, monkeypatch):
+        """LLMWriter raises ImportError if anthropic is not installed."""
+        from skyknit.writer.llm_writer import LLMWriter
+
+        # The anthropic import is deferred to __init__, so blocking the module
+        # in sys.modules is enough — no reload of llm_writer required.
+        monkeypatch.setitem(sys.modules, "anthropic", None)
+        with pytest.raises(ImportError, match="uv add anthropic"):
+            LLMWriter()
+
+
+# ── Integration tests (recorded responses) ────────────────────────────────────
+#
+# Each integration test runs twice.  The ``replay`` case answers the writer and
+# round-trip parser calls from fixtures/llm_cassettes/ with no network and no
+# anthropic package, and skips while no recordings exist.  The ``live`` case is
+# always marked ``slow``, needs ANTHROPIC_API_KEY and always calls the API.
+# With SKYKNIT_LLM_RECORD=1 the live case also overwrites the cassettes with
+# its responses; that is how recordings are created and refreshed:
+#
+#     SKYKNIT_LLM_RECORD=1 ANTHROPIC_API_KEY=... pytest tests/writer -m slow
+
+_CASSETTE_DIR = Path(__file__).parent / "fixtures" / "llm_cassettes"
+_RECORD_LLM = os.environ.get("SKYKNIT_LLM_RECORD") == "1"
+
+_SKIP_NO_CASSETTES = pytest.mark.skipif(
+    not any(_CASSETTE_DIR.glob("*.json")),
+    reason="no recorded LLM responses — replay tests skipped",
+)
+_SKIP_NO_KEY = pytest.mark.skipif(
+    os.environ.get("ANTHROPIC_API_KEY") is None,
+    reason="ANTHROPIC_API_KEY not set — live LLM tests skipped",
+)
 
-            writer = LLMWriter()
-        assert isinstance(writer, PatternWriter)
 
-    def test_import_error_without_anthropic(self):
-        """LLMWriter raises ImportError if anthropic is not installed."""
-        import importlib
-        from unittest.mock import patch
+@pytest.fixture(
+    params=[
+        pytest.param("replay", marks=_SKIP_NO_CASSETTES),
+        pytest.param("live", marks=[pytest.mark.slow, _SKIP_NO_KEY]),
+    ]
+)
+def llm_mode(request, monkeypatch) -> str:
+    """Select replay or live mode and make ``import anthropic`` resolve for it.
+
+    Live runs drop any session stub so the real package is imported; replay
+    runs install the stub, since every call is answered from a cassette.
+    """
+    if request.param == "live":
+        monkeypatch.delitem(sys.modules, "anthropic", raising=False)
+    else:
+        request.getfixturevalue("anthropic_stub")
+    return request.param
+
+
+def _route_client(mode: str, client):
+    """Return the client an LLM integration test should call in *mode*."""
+    from skyknit.writer._llm_cassette import CassetteClient
+
+    if mode == "replay":
+        return CassetteClient(_CASSETTE_DIR)
+    if _RECORD_LLM:
+        return CassetteClient(_CASSETTE_DIR, client, record=True)
+    return client
 
-        import skyknit.writer.llm_writer as llm_mod
 
-        with patch.dict(sys.modules, {"anthropic": None}):  # type: ignore[dict-item]
-            importlib.reload(llm_mod)
-            with pytest.raises(ImportError, match="uv add anthropic"):
-                llm_mod.LLMWriter()
+@pytest.fixture
+def cassette_llm_writer(llm_mode):
+    """LLMWriter whose client replays from, calls or records to the cassettes."""
+    from skyknit.writer.llm_writer import LLMWriter
 
-        # Restore the module to its normal state after the test.
-        importlib.reload(llm_mod)
+    writer = LLMWriter(gauge=GAUGE, stitch_motif=MOTIF, yarn_spec=YARN)
+    writer._client = _route_client(llm_mode, writer._client)
+    return writer
 
 
-# ── Integration tests (skipped in CI) ─────────────────────────────────────────
+@pytest.fixture
+def cassette_llm_parser(llm_mode):
+    """LLMPatternParser whose client replays from, calls or records to the cassettes."""
+    from skyknit.parser.parser import LLMPatternParser
 
-_SKIP_LLM = pytest.mark.skipif(
-    os.environ.get("ANTHROPIC_API_KEY") is None,
-    reason="ANTHROPIC_API_KEY not set — LLM integration tests skipped",
-)
+    parser = LLMPatternParser()
+    parser._client = _route_client(llm_mode, parser._client)
+    return parser
 
 
-@_SKIP_LLM
-def test_llm_writer_drop_shoulder():
+@pytest.mark.filterwarnings("error:LLMWriter failed")
+def test_llm_writer_drop_shoulder(
+    cassette_llm_writer, cassette_llm_parser, drop_shoulder_writer_input
+):
     """LLMWriter produces a non-empty pattern that parses back through check_all()."""
     from skyknit.api.validate import validate_pattern
-    from skyknit.writer.llm_writer import LLMWriter
 
-    wi = _drop_shoulder_writer_input()
-    writer = LLMWriter(gauge=_GAUGE, stitch_motif=_MOTIF, yarn_spec=_YARN)
-    out = writer.write(wi)
+    out = cassette_llm_writer.write(drop_shoulder_writer_input)
     assert out.full_pattern.strip()
-    report = validate_pattern(out.full_pattern, _GAUGE, _MOTIF, _YARN)
+    report = validate_pattern(out.full_pattern, GAUGE, MOTIF, YARN, parser=cassette_llm_parser)
     assert report.passed, f"Round-trip failed:\n{report.parse_error}\n{report.checker_result}"
 
 
-@_SKIP_LLM
-def test_llm_writer_differs_from_template():
+@pytest.mark.filterwarnings("error:LLMWriter failed")
+def test_llm_writer_differs_from_template(
+    cassette_llm_writer, drop_shoulder_writer_input, template_out_drop_shoulder
+):
     """LLM output should produce richer prose than the mechanical template."""
-    from skyknit.writer.llm_writer import LLMWriter
-    from skyknit.writer.writer import TemplateWriter
-
-    wi = _drop_shoulder_writer_input()
-    template_out = TemplateWriter().write(wi)
-    llm_out = LLMWriter(gauge=_GAUGE, stitch_motif=_MOTIF, yarn_spec=_YARN).write(wi)
-    assert llm_out.full_pattern != template_out.full_pattern
+    llm_out = cassette_llm_writer.write(drop_shoulder_writer_input)
+    assert llm_out.full_pattern != template_out_drop_shoulder.full_pattern
@@ -2,65 +2,29 @@
 
 from __future__ import annotations
 
+import re
 from types import MappingProxyType
 
 import pytest
 
-import skyknit.planner.garments  # noqa: F401 — triggers registration
-from skyknit.fabric.module import FabricInput
 from skyknit.orchestrator.pipeline import DeterministicOrchestrator, OrchestratorInput
 from skyknit.planner.garments.registry import get
-from skyknit.schemas.constraint import StitchMotif, YarnSpec
 from skyknit.schemas.ir import ComponentIR, make_bind_off, make_cast_on, make_work_even
 from skyknit.schemas.manifest import ComponentSpec, Handedness, ShapeManifest, ShapeType
-from skyknit.schemas.proportion import PrecisionPreference, ProportionSpec
 from skyknit.topology.types import Edge, EdgeType, Join, JoinType
-from skyknit.utilities.types import Gauge
 from skyknit.writer.writer import PatternWriter, TemplateWriter, WriterInput, WriterOutput
 
-# ── Shared pipeline helpers ────────────────────────────────────────────────────
-
-
-_PROPORTION = ProportionSpec(
-    ratios=MappingProxyType({"body_ease": 1.08, "sleeve_ease": 1.1, "wrist_ease": 1.05}),
-    precision=PrecisionPreference.MEDIUM,
-)
-
-_FABRIC = FabricInput(
-    component_names=(),
-    gauge=Gauge(stitches_per_inch=20.0, rows_per_inch=28.0),
-    stitch_motif=StitchMotif(name="stockinette", stitch_repeat=1, row_repeat=1),
-    yarn_spec=YarnSpec(weight="DK", fiber="wool", needle_size_mm=4.0),
-    precision=PrecisionPreference.MEDIUM,
-)
-
-_MEASUREMENTS_DROP = {
-    "chest_circumference_mm": 914.4,
-    "body_length_mm": 457.2,
-    "sleeve_length_mm": 495.3,
-    "upper_arm_circumference_mm": 381.0,
-    "wrist_circumference_mm": 152.4,
-}
-
-_MEASUREMENTS_YOKE = {**_MEASUREMENTS_DROP, "yoke_depth_mm": 228.6}
+from ._fixtures import FABRIC, MEASUREMENTS_YOKE, PROPORTION
 
-
-def _drop_shoulder_output():
-    oi = OrchestratorInput(
-        garment_spec=get("top-down-drop-shoulder-pullover"),
-        proportion_spec=_PROPORTION,
-        measurements=_MEASUREMENTS_DROP,
-        fabric_input=_FABRIC,
-    )
-    return DeterministicOrchestrator().run(oi)
+# ── Shared pipeline helpers ────────────────────────────────────────────────────
 
 
 def _yoke_output():
     oi = OrchestratorInput(
         garment_spec=get("top-down-yoke-pullover"),
-        proportion_spec=_PROPORTION,
-        measurements=_MEASUREMENTS_YOKE,
-        fabric_input=_FABRIC,
+        proportion_spec=PROPORTION,
+        measurements=dict(MEASUREMENTS_YOKE),
+        fabric_input=FABRIC,
     )
     return DeterministicOrchestrator().run(oi)
 
@@ -73,6 +37,12 @@ def _writer_input_from(output) -> WriterInput:
     )
 
 
+def _headers_in(full_pattern: str, headers: list[str]) -> list[str]:
+    """Return the header lines of *full_pattern* in order, found in a single regex pass."""
+    pattern = re.compile(rf"^(?:{'|'.join(map(re.escape, headers))})$", re.MULTILINE)
+    return [m.group() for m in pattern.finditer(full_pattern)]
+
+
 # ── Minimal fixture helpers ────────────────────────────────────────────────────
 
 
@@ -101,25 +71,31 @@ def _make_simple_ir(name: str, count: int, handedness: Handedness = Handedness.N
 
 
 class TestWriterInput:
-    def test_is_frozen(self):
-        output = _drop_shoulder_output()
-        wi = _writer_input_from(output)
+    def test_is_frozen(self, drop_shoulder_writer_input):
+        wi = drop_shoulder_writer_input
         with pytest.raises((AttributeError, TypeError)):
             wi.component_order = []  # type: ignore[misc]
 
-    def test_template_writer_satisfies_protocol(self):
-        assert isinstance(TemplateWriter(), PatternWriter)
+
+@pytest.mark.parametrize(
+    "writer_fixture",
+    [
+        pytest.param("template_writer", id="template"),
+        pytest.param("llm_writer", id="llm"),
+    ],
+)
+def test_satisfies_pattern_writer_protocol(request, writer_fixture):
+    assert isinstance(request.getfixturevalue(writer_fixture), PatternWriter)
 
 
 # ── Drop shoulder writer ───────────────────────────────────────────────────────
 
 
 class TestDropShoulderWriter:
-    def setup_method(self):
-        output = _drop_shoulder_output()
-        wi = _writer_input_from(output)
-        self.wo = TemplateWriter().write(wi)
-        self.order = output.component_order
+    @pytest.fixture(autouse=True)
+    def _output(self, drop_shoulder_writer_input, template_out_drop_shoulder):
+        self.wo = template_out_drop_shoulder
+        self.order = drop_shoulder_writer_input.component_order
 
     def test_returns_writer_output(self):
         assert isinstance(self.wo, WriterOutput)
@@ -153,14 +129,12 @@ class TestDropShoulderWriter:
 
     def test_full_pattern_sections_in_order(self):
         # Each section header should appear in component_order sequence in full_pattern.
-        positions = [
-            self.wo.full_pattern.index(name.replace("_", " ").title()) for name in self.order
-        ]
-        assert positions == sorted(positions)
+        headers = [name.replace("_", " ").title() for name in self.order]
+        assert _headers_in(self.wo.full_pattern, headers) == headers
 
     def test_bind_off_in_each_section(self):
-        for section_text in self.wo.sections.values():
-            assert "Bind off" in section_text
+        missing = [name for name, text in self.wo.sections.items() if "Bind off" not in text]
+        assert not missing, f"'Bind off' missing from sections: {missing}"
 
 
 # ── Yoke pullover writer ───────────────────────────────────────────────────────
@@ -190,74 +164,104 @@ class TestYokeWriter:
         assert "Work even" in self.wo.sections["yoke"]
 
     def test_full_pattern_has_all_sections(self):
-        for name in self.order:
-            assert name.replace("_", " ").title() in self.wo.full_pattern
+        headers = [name.replace("_", " ").title() for name in self.order]
+        assert _headers_in(self.wo.full_pattern, headers) == headers
 
 
 # ── Join-type-specific tests using minimal fixtures ───────────────────────────
 
 
+@pytest.fixture(scope="module")
+def held_stitch_writer_output() -> WriterOutput:
+    """Body → sleeve topology joined by a single HELD_STITCH join."""
+    # Upstream: body with LIVE_STITCH underarm edge
+    # Downstream: sleeve with LIVE_STITCH top edge receiving held stitches
+    body_spec = _make_spec(
+        "body",
+        (
+            Edge(name="top", edge_type=EdgeType.CAST_ON),
+            Edge(name="underarm", edge_type=EdgeType.LIVE_STITCH, join_ref="j_underarm"),
+            Edge(name="hem", edge_type=EdgeType.BOUND_OFF),
+        ),
+    )
+    sleeve_spec = _make_spec(
+        "sleeve",
+        (
+            Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j_underarm"),
+            Edge(name="cuff", edge_type=EdgeType.BOUND_OFF),
+        ),
+    )
+    body_ir = ComponentIR(
+        component_name="body",
+        handedness=Handedness.NONE,
+        operations=(make_cast_on(80), make_work_even(20, 80), make_bind_off(80)),
+        starting_stitch_count=80,
+        ending_stitch_count=0,
+    )
+    sleeve_ir = ComponentIR(
+        component_name="sleeve",
+        handedness=Handedness.NONE,
+        operations=(make_work_even(40, 60), make_bind_off(60)),
+        starting_stitch_count=60,
+        ending_stitch_count=0,
+    )
+    join = Join.create(
+        id="j_underarm",
+        join_type=JoinType.HELD_STITCH,
+        edge_a_ref="body.underarm",
+        edge_b_ref="sleeve.top",
+    )
+    manifest = ShapeManifest(
+        components=(body_spec, sleeve_spec),
+        joins=(join,),
+    )
+    wi = WriterInput(
+        manifest=manifest,
+        irs={"body": body_ir, "sleeve": sleeve_ir},
+        component_order=["body", "sleeve"],
+    )
+    return TemplateWriter().write(wi)
+
+
+@pytest.fixture(scope="module")
+def seam_writer_output() -> WriterOutput:
+    """Two fronts joined along their side edges by a single SEAM join."""
+    left_spec = _make_spec("left_front", (Edge(name="side", edge_type=EdgeType.BOUND_OFF),))
+    right_spec = _make_spec("right_front", (Edge(name="side", edge_type=EdgeType.BOUND_OFF),))
+    left_ir = _make_simple_ir("left_front", 60)
+    right_ir = _make_simple_ir("right_front", 60)
+    seam_join = Join.create(
+        id="j_side_seam",
+        join_type=JoinType.SEAM,
+        edge_a_ref="left_front.side",
+        edge_b_ref="right_front.side",
+        parameters={"seam_method": "mattress_stitch"},
+    )
+    manifest = ShapeManifest(
+        components=(left_spec, right_spec),
+        joins=(seam_join,),
+    )
+    wi = WriterInput(
+        manifest=manifest,
+        irs={"left_front": left_ir, "right_front": right_ir},
+        component_order=["left_front", "right_front"],
+    )
+    return TemplateWriter().write(wi)
+
+
 class TestHeldStitchJoin:
     """HELD_STITCH join → 'holder' in downstream section."""
 
-    def test_holder_in_downstream_section(self):
-        # Upstream: body with LIVE_STITCH underarm edge
-        # Downstream: sleeve with LIVE_STITCH top edge receiving held stitches
-        body_spec = _make_spec(
-            "body",
-            (
-                Edge(name="top", edge_type=EdgeType.CAST_ON),
-                Edge(name="underarm", edge_type=EdgeType.LIVE_STITCH, join_ref="j_underarm"),
-                Edge(name="hem", edge_type=EdgeType.BOUND_OFF),
-            ),
-        )
-        sleeve_spec = _make_spec(
-            "sleeve",
-            (
-                Edge(name="top", edge_type=EdgeType.LIVE_STITCH, join_ref="j_underarm"),
-                Edge(name="cuff", edge_type=EdgeType.BOUND_OFF),
-            ),
-        )
-        body_ir = ComponentIR(
-            component_name="body",
-            handedness=Handedness.NONE,
-            operations=(make_cast_on(80), make_work_even(20, 80), make_bind_off(80)),
-            starting_stitch_count=80,
-            ending_stitch_count=0,
-        )
-        sleeve_ir = ComponentIR(
-            component_name="sleeve",
-            handedness=Handedness.NONE,
-            operations=(make_work_even(40, 60), make_bind_off(60)),
-            starting_stitch_count=60,
-            ending_stitch_count=0,
-        )
-        join = Join(
-            id="j_underarm",
-            join_type=JoinType.HELD_STITCH,
-            edge_a_ref="body.underarm",
-            edge_b_ref="sleeve.top",
-        )
-        manifest = ShapeManifest(
-            components=(body_spec, sleeve_spec),
-            joins=(join,),
-        )
-        wi = WriterInput(
-            manifest=manifest,
-            irs={"body": body_ir, "sleeve": sleeve_ir},
-            component_order=["body", "sleeve"],
-        )
-        wo = TemplateWriter().write(wi)
-        assert "holder" in wo.sections["sleeve"].lower()
+    def test_holder_in_downstream_section(self, held_stitch_writer_output):
+        assert "holder" in held_stitch_writer_output.sections["sleeve"].lower()
 
 
 class TestPickupJoinNoRedundantCastOn:
     """PICKUP join: Writer should not emit a CAST_ON op after the pick-up instruction."""
 
-    def setup_method(self):
-        output = _drop_shoulder_output()
-        wi = _writer_input_from(output)
-        self.wo = TemplateWriter().write(wi)
+    @pytest.fixture(autouse=True)
+    def _output(self, template_out_drop_shoulder):
+        self.wo = template_out_drop_shoulder
 
     def test_no_redundant_cast_on_in_pickup_sleeve(self):
         # left_sleeve is joined via PICKUP — the join instruction already says
@@ -274,30 +278,9 @@ class TestPickupJoinNoRedundantCastOn:
 class TestSeamJoin:
     """SEAM join → seam note in header of both sections."""
 
-    def test_seam_note_in_section_headers(self):
-        left_spec = _make_spec("left_front", (Edge(name="side", edge_type=EdgeType.BOUND_OFF),))
-        right_spec = _make_spec("right_front", (Edge(name="side", edge_type=EdgeType.BOUND_OFF),))
-        left_ir = _make_simple_ir("left_front", 60)
-        right_ir = _make_simple_ir("right_front", 60)
-        seam_join = Join(
-            id="j_side_seam",
-            join_type=JoinType.SEAM,
-            edge_a_ref="left_front.side",
-            edge_b_ref="right_front.side",
-            parameters={"seam_method": "mattress_stitch"},
-        )
-        manifest = ShapeManifest(
-            components=(left_spec, right_spec),
-            joins=(seam_join,),
-        )
-        wi = WriterInput(
-            manifest=manifest,
-            irs={"left_front": left_ir, "right_front": right_ir},
-            component_order=["left_front", "right_front"],
-        )
-        wo = TemplateWriter().write(wi)
+    def test_seam_note_in_section_headers(self, seam_writer_output):
         # Both sections should have a seam note in their header line.
-        left_header = wo.sections["left_front"].splitlines()[0]
-        right_header = wo.sections["right_front"].splitlines()[0]
+        left_header = seam_writer_output.sections["left_front"].splitlines()[0]
+        right_header = seam_writer_output.sections["right_front"].splitlines()[0]
         assert "seam" in left_header.lower() or "Seam" in left_header
         assert "seam" in right_header.lower() or "Seam" in right_header